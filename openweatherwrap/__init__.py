@@ -20,16 +20,38 @@ print(weather_data.get_current_temp())
 ```
 """
 
-import requests # Using the checks from the library to check if it works
-
 __version__ = "1.1.0"
 __author__ = "lythox"
 __license__ = "Attribution-ShareAlike 4.0 International"
 
+from typing import Any, Coroutine
+
 
 __all__ = [
     "api",
     "asyncapi",
     "errors",
-    "core"
-]
\ No newline at end of file
+    "core",
+    "run_with_uvloop"
+]
+
+
+def run_with_uvloop(main: Coroutine) -> Any:
+    """
+    Runs a coroutine on a uvloop event loop, which speeds up the asynchronous wrappers when many requests run concurrently.
+
+    Use it in place of `asyncio.run`. It calls `uvloop.run`, which does not rely on the event loop policy API that is deprecated since Python 3.14.
+    uvloop is installed with the optional `uvloop` extra and is not available on Windows.
+
+    Args:
+        main (Coroutine): The coroutine to run, e.g. `main()`.
+
+    Returns:
+        Any: The result of the coroutine.
+
+    Raises:
+        ImportError: If uvloop is not installed.
+    """
+    import uvloop
+
+    return uvloop.run(main)
@@ -3,18 +3,240 @@ Utility functions for OpenWeatherWrap.
 
 This module provides helper functions to assist with the OpenWeatherWrap library, and is not intended for direct use by end users.
 """
-import requests
-import aiohttp
+import os
+import time
+import hashlib
+import asyncio
+import threading
 
-from openweatherwrap.errors import InvalidAPIKeyError, NotFoundError, OpenWeatherMapException, SubscriptionLevelError, TooManyRequestsError
+from collections import OrderedDict, deque
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING
 
-def _make_get_request(url) -> requests.Response:
+if TYPE_CHECKING:
+    # requests and aiohttp are only imported once a request is made, so each API only loads the HTTP client it uses
+    import aiohttp
+    import diskcache
+    import requests
+
+try:
+    import orjson as _json
+except ImportError: # orjson is an optional speedup, fall back to the standard library
+    import json as _json
+
+from openweatherwrap import __version__
+from openweatherwrap.errors import OpenWeatherMapException
+
+_HEADERS = {'User-Agent': f'openweatherwrap/{__version__}'}
+
+# Rate limited and temporarily unavailable responses are retried with exponential backoff
+_RETRY_STATUSES = (429, 502, 503, 504)
+_RETRIES = 3
+_BACKOFF = 0.3
+# Longest delay before a retry; when the server asks to wait longer, the error is raised right away
+_MAX_RETRY_DELAY = 10.0
+
+@cache
+def _get_session() -> "requests.Session":
+    """
+    Get the `requests.Session` with a pooled, retrying HTTPS adapter, creating it on first use.
+
+    The session is shared by all synchronous API wrappers so that TCP and TLS connections to the OpenWeatherMap servers are reused between calls.
+
+    Returns:
+        requests.Session: The shared session.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.exceptions import MaxRetryError
+    from urllib3.util.retry import Retry
+
+    class _Retry(Retry):
+        """`Retry` that waits at most `_MAX_RETRY_DELAY` seconds and gives up when `Retry-After` asks for longer."""
+
+        def get_backoff_time(self) -> float:
+            return min(super().get_backoff_time(), _MAX_RETRY_DELAY)
+
+        def increment(self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None):
+            if response is not None and (self.get_retry_after(response) or 0) > _MAX_RETRY_DELAY:
+                # With raise_on_status disabled the response is returned and mapped to its exception
+                raise MaxRetryError(_pool, url, error)
+            return super().increment(method, url, response, error, _pool, _stacktrace)
+
+    session = requests.Session()
+    session.headers.update(_HEADERS)
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=_Retry(total=_RETRIES, backoff_factor=_BACKOFF, status_forcelist=_RETRY_STATUSES, raise_on_status=False, respect_retry_after_header=True)
+    )
+    session.mount("https://", adapter)
+    return session
+
+def _close_session() -> None:
+    """Close the connections of the shared synchronous session, if it was created."""
+    if _get_session.cache_info().currsize:
+        _get_session().close()
+
+class _RateLimiter:
+    """
+    Limits requests to a number of calls per period, shared between threads and coroutines.
+
+    Each call reserves the earliest slot in which it keeps the limit, and then waits until that slot is reached.
+    """
+    def __init__(self, calls: int, period: float) -> None:
+        """
+        Args:
+            calls (int): Maximum number of requests per period.
+            period (float): Length of the period in seconds.
+        """
+        self.calls = calls
+        self.period = period
+        self._slots = deque(maxlen=calls)
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """
+        Reserves the next free slot.
+
+        Returns:
+            float: Seconds to wait until the reserved slot is reached.
+        """
+        with self._lock:
+            now = time.monotonic()
+            start = now
+            if len(self._slots) == self.calls:
+                start = max(now, self._slots[0] + self.period)
+            self._slots.append(start)
+            return start - now
+
+    def wait(self) -> None:
+        """Blocks until a request is allowed."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_async(self) -> None:
+        """Waits until a request is allowed without blocking the event loop."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+@cache
+def _get_rate_limiter(api_key: str, calls: int, period: float) -> _RateLimiter:
+    """
+    Get the rate limiter for an API key, so all instances using the same key share one limit.
+
+    Args:
+        api_key (str): The OpenWeatherMap API key.
+        calls (int): Maximum number of requests per period.
+        period (float): Length of the period in seconds.
+
+    Returns:
+        _RateLimiter: The shared rate limiter.
+    """
+    return _RateLimiter(calls, period)
+
+@cache
+def _get_geolocator():
+    """
+    Get the Nominatim geolocator, importing geopy on first use.
+
+    geopy is only needed for locations given by name, so it is not imported when only coordinates are used.
+
+    Returns:
+        geopy.geocoders.Nominatim: The geolocator.
+    """
+    from geopy.geocoders import Nominatim
+    return Nominatim(user_agent="openweatherwrap")
+
+@lru_cache(maxsize=1024)
+def _geocode(location: str) -> tuple[float, float]:
+    """
+    Resolve a location name to its coordinates using Nominatim.
+
+    Results are memoized, so creating several API wrappers for the same location only geocodes it once.
+
+    Args:
+        location (str): The name of the location, e.g. "London, England".
+
+    Returns:
+        tuple[float, float]: The (latitude, longitude) of the location.
+
+    Raises:
+        ValueError: If the location is not found.
+    """
+    location_data = _get_geolocator().geocode(location)
+    if not location_data:
+        raise ValueError("Location not found. Please provide a valid location.")
+    return (location_data.latitude, location_data.longitude)
+
+def _parse(response: "requests.Response") -> dict | list:
+    """
+    Decode the JSON body of a response.
+
+    Uses `orjson` when it is installed, which parses the raw bytes directly instead of decoding them to a string first.
+
+    Args:
+        response (requests.Response): The response to decode.
+
+    Returns:
+        dict | list: The decoded JSON data.
+    """
+    return _json.loads(response.content)
+
+# Every error class declares the status code it is raised for
+_ERROR_MAP: dict[int, type[OpenWeatherMapException]] = {error.HTTP_STATUS: error for error in OpenWeatherMapException.__subclasses__() if hasattr(error, 'HTTP_STATUS')}
+
+def _raise_for_status(status_code: int, content: bytes, error_map: dict[int, type[OpenWeatherMapException]] = _ERROR_MAP) -> None:
+    """
+    Raise the exception matching the status code of a response, if the request was not successful.
+
+    Args:
+        status_code (int): The HTTP status code of the response.
+        content (bytes): The raw body of the response, used to extract the error message.
+        error_map (dict[int, type[OpenWeatherMapException]]): Mapping of status codes to the exceptions to raise for them.
+
+    Raises:
+        SubscriptionLevelError: If the API key does not have access to the requested data.
+        InvalidAPIKeyError: If the API key is invalid.
+        NotFoundError: If the location is not found.
+        TooManyRequestsError: If the API rate limit is exceeded.
+        OpenWeatherMapException: For any other unsuccessful status code.
+    """
+    if status_code in (200, 304):
+        return
+    raise error_map.get(status_code, OpenWeatherMapException)(_extract_message(content))
+
+def _extract_message(content: bytes) -> str:
+    """
+    Extract the error message from the body of an unsuccessful response.
+
+    The body is only decoded to text if it is not a JSON object with a non-empty `message`.
+
+    Args:
+        content (bytes): The raw body of the response.
+
+    Returns:
+        str: The error message.
+    """
+    try:
+        error_message = _json.loads(content).get('message')
+    except (ValueError, AttributeError): # Not JSON, or JSON without a top-level object
+        error_message = None
+    return error_message or content.decode(errors='replace')
+
+def _make_get_request(url: str, params: dict | None = None, error_map: dict[int, type[OpenWeatherMapException]] = _ERROR_MAP, headers: dict | None = None, limiter: _RateLimiter | None = None, timeout: tuple[float, float] = (3.05, 10.0)) -> "requests.Response":
     """
     Make a synchronous GET request to the specified URL with the given parameters.
 
     Args:
         url (str): The URL to send the GET request to.
-        params (dict): The parameters to include in the GET request.
+        params (dict | None): The query parameters to include in the GET request.
+        error_map (dict[int, type[OpenWeatherMapException]]): Mapping of status codes to the exceptions to raise for them.
+        headers (dict | None): Additional headers to send with the request.
+        limiter (_RateLimiter | None): Rate limiter to wait for before sending the request.
+        timeout (tuple[float, float]): Connect and read timeouts in seconds.
 
     Returns:
         dict: The JSON response from the server.
@@ -26,34 +248,268 @@ def _make_get_request(url) -> requests.Response:
         TooManyRequestsError: If the API rate limit is exceeded.
         OpenWeatherMapException: For internal server errors (500, 502, 503, 504).
     """
-    data = requests.get(url)
-    if data.status_code == 200:
+    if limiter is not None:
+        limiter.wait()
+    data = _get_session().get(url, params=params, headers=headers, timeout=timeout)
+    _raise_for_status(data.status_code, data.content, error_map)
+    return data
+
+class _LRUCache:
+    """
+    Small thread-safe in-memory LRU cache.
+
+    Used for responses that never expire, such as geocoding results, so repeated lookups are answered without touching the disk or the network.
+    Values are stored as JSON, so every hit returns a fresh object that the caller may modify.
+    """
+    def __init__(self, maxsize: int) -> None:
+        """
+        Args:
+            maxsize (int): Maximum number of entries. The least recently used entry is dropped when it is exceeded.
+        """
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Returns the value stored for a key, or None if it is not cached."""
+        with self._lock:
+            raw = self._data.get(key)
+            if raw is None:
+                return None
+            self._data.move_to_end(key)
+        return _json.loads(raw)
+
+    def set(self, key, value) -> None:
+        """Stores a value for a key, dropping the least recently used entry if the cache is full."""
+        raw = _json.dumps(value)
+        with self._lock:
+            self._data[key] = raw
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+_immutable_responses = _LRUCache(4096)
+
+@cache
+def _get_cache():
+    """
+    Get the on-disk response cache, importing diskcache and creating the cache on first use.
+
+    Returns:
+        diskcache.Cache | None: The cache stored in `~/.cache/openweatherwrap`, or None if `diskcache` is not installed.
+    """
+    try:
+        from diskcache import Cache
+    except ImportError: # diskcache is optional, responses are not cached without it
+        return None
+    return Cache(os.path.join(os.path.expanduser("~"), ".cache", "openweatherwrap"))
+
+def _cache_key(tag: str, url: str, params: dict) -> tuple:
+    """
+    Build the response cache key of a request.
+
+    The API key is replaced by its SHA-256 hash, so it is not stored in plain text in the cache directory.
+
+    Args:
+        tag (str): Tag of the endpoint.
+        url (str): The URL of the request.
+        params (dict): The query parameters of the request.
+
+    Returns:
+        tuple: The cache key.
+    """
+    items = tuple(sorted((name, hashlib.sha256(value.encode()).hexdigest() if name == 'appid' else value) for name, value in params.items()))
+    return (tag, url, items)
+
+def _make_cached_get_request(url: str, params: dict, expire: float | None, tag: str, error_map: dict[int, type[OpenWeatherMapException]] = _ERROR_MAP, limiter: _RateLimiter | None = None, timeout: tuple[float, float] = (3.05, 10.0), use_cache: bool = False) -> dict | list:
+    """
+    Make a synchronous GET request and return the decoded JSON, serving repeated requests from the response cache.
+
+    Only the decoded JSON is cached, never the response objects. Responses that never expire are also kept in memory, so they are reused even if the on-disk cache is disabled or `diskcache` is not installed.
+
+    Expired responses that came with an `ETag` or `Last-Modified` header are kept for another day and revalidated with a conditional request.
+    If the server answers with 304 Not Modified, the cached data is reused without transferring or decoding the body again.
+
+    Args:
+        url (str): The URL to send the GET request to.
+        params (dict): The query parameters to include in the GET request.
+        expire (float | None): Seconds after which the cached response expires. None means the response never expires.
+        tag (str): Tag to store the cached response under, usually the name of the endpoint.
+        error_map (dict[int, type[OpenWeatherMapException]]): Mapping of status codes to the exceptions to raise for them.
+        limiter (_RateLimiter | None): Rate limiter to wait for before sending a request. Cache hits are not limited.
+        timeout (tuple[float, float]): Connect and read timeouts in seconds.
+        use_cache (bool): If False, the on-disk response cache is not used.
+
+    Returns:
+        dict | list: The JSON response from the server.
+
+    Raises:
+        SubscriptionLevelError: If the API key does not have access to the requested data.
+        InvalidAPIKeyError: If the API key is invalid.
+        NotFoundError: If the location is not found.
+        TooManyRequestsError: If the API rate limit is exceeded.
+        OpenWeatherMapException: For internal server errors (500, 502, 503, 504).
+    """
+    key = _cache_key(tag, url, params)
+    if expire is None and (data := _immutable_responses.get(key)) is not None:
         return data
+    response_cache = _get_cache() if use_cache else None
+    if response_cache is None:
+        data = _parse(_make_get_request(url, params, error_map, limiter=limiter, timeout=timeout))
+    elif (entry := response_cache.get(key)) is not None and _is_fresh(entry):
+        data = entry[3]
     else:
+        response = _make_get_request(url, params, error_map, _revalidation_headers(entry), limiter, timeout)
+        if response.status_code == 304:
+            _, etag, last_modified, data = entry
+        else:
+            data = _parse(response)
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+        _store_cached(response_cache, key, expire, tag, etag, last_modified, data)
+    if expire is None:
+        _immutable_responses.set(key, data)
+    return data
+
+def _is_fresh(entry: tuple) -> bool:
+    """
+    Check whether a cached response can be used without asking the server.
+
+    Args:
+        entry (tuple): The cached `(fresh_until, etag, last_modified, data)` entry.
+
+    Returns:
+        bool: True if the entry never expires or has not expired yet.
+    """
+    fresh_until = entry[0]
+    return fresh_until is None or time.time() < fresh_until
+
+def _revalidation_headers(entry: tuple | None) -> dict | None:
+    """
+    Build the conditional request headers to revalidate a stale cached response.
+
+    Args:
+        entry (tuple | None): The cached `(fresh_until, etag, last_modified, data)` entry, or None if nothing is cached.
+
+    Returns:
+        dict | None: The `If-None-Match` and `If-Modified-Since` headers, or None if nothing is cached.
+    """
+    if entry is None:
+        return None
+    _, etag, last_modified, _ = entry
+    headers = {}
+    if etag:
+        headers['If-None-Match'] = etag
+    if last_modified:
+        headers['If-Modified-Since'] = last_modified
+    return headers
+
+def _store_cached(response_cache: "diskcache.Cache", key: tuple, expire: float | None, tag: str, etag: str | None, last_modified: str | None, data: dict | list) -> None:
+    """
+    Store a decoded response in the response cache.
+
+    Args:
+        response_cache (diskcache.Cache): The response cache.
+        key (tuple): The cache key of the request.
+        expire (float | None): Seconds after which the response expires. None means it never expires.
+        tag (str): Tag to store the response under.
+        etag (str | None): The `ETag` header of the response.
+        last_modified (str | None): The `Last-Modified` header of the response.
+        data (dict | list): The decoded JSON response.
+    """
+    if expire is None:
+        response_cache.set(key, (None, etag, last_modified, data), tag=tag)
+    else:
+        # Keep revalidatable responses around for a day after they went stale
+        keep = expire + 86400 if etag or last_modified else expire
+        response_cache.set(key, (time.time() + expire, etag, last_modified, data), expire=keep, tag=tag)
+
+
+def _create_async_session() -> "aiohttp.ClientSession":
+    """
+    Create an `aiohttp.ClientSession` that keeps connections to the OpenWeatherMap servers alive.
+
+    Must be called from within a running event loop.
+
+    Returns:
+        aiohttp.ClientSession: The configured session.
+    """
+    import aiohttp
+
+    connector = aiohttp.TCPConnector(limit_per_host=64, keepalive_timeout=75)
+    return aiohttp.ClientSession(connector=connector, headers=_HEADERS)
+
+def _retry_delay(retry_after: str | None, attempt: int) -> float:
+    """
+    Compute how long to wait before retrying a request.
+
+    Args:
+        retry_after (str | None): The `Retry-After` header of the response, if any.
+        attempt (int): Number of the failed attempt, starting at 0.
+
+    Returns:
+        float: The delay in seconds, taken from `Retry-After` if it is given in seconds, otherwise an exponential backoff capped at `_MAX_RETRY_DELAY`.
+    """
+    if retry_after is not None and retry_after.isdigit():
+        return float(retry_after)
+    return min(_BACKOFF * 2 ** attempt, _MAX_RETRY_DELAY)
+
+async def _send_async(session: "aiohttp.ClientSession", url: str, params: dict | None, headers: dict | None, limiter: _RateLimiter | None, timeout: tuple[float, float]) -> "tuple[aiohttp.ClientResponse, bytes]":
+    """
+    Send an asynchronous GET request, retrying connection errors, timeouts and responses with a status in `_RETRY_STATUSES`.
+
+    This mirrors the `Retry` policy mounted on the synchronous session: up to `_RETRIES` retries with exponential backoff, honouring the `Retry-After` header.
+    A response whose `Retry-After` exceeds `_MAX_RETRY_DELAY` is returned without retrying.
+    Each attempt waits for the rate limiter.
+
+    Args:
+        session (aiohttp.ClientSession): The session to send the request with.
+        url (str): The URL to send the GET request to.
+        params (dict | None): The query parameters to include in the GET request.
+        headers (dict | None): Additional headers to send with the request.
+        limiter (_RateLimiter | None): Rate limiter to wait for before each attempt.
+        timeout (tuple[float, float]): Connect and read timeouts in seconds.
+
+    Returns:
+        tuple[aiohttp.ClientResponse, bytes]: The last response and its body.
+
+    Raises:
+        aiohttp.ClientConnectionError: If the connection still fails after the last retry.
+        asyncio.TimeoutError: If the request still times out after the last retry.
+    """
+    import aiohttp
+
+    client_timeout = aiohttp.ClientTimeout(sock_connect=timeout[0], sock_read=timeout[1])
+    for attempt in range(_RETRIES + 1):
+        if limiter is not None:
+            await limiter.wait_async()
         try:
-            error_message = data.json().get('message', data.text)
-        except Exception:
-            error_message = data.text
-        match data.status_code:
-            case 400000:
-                raise SubscriptionLevelError(error_message)
-            case 401:
-                raise InvalidAPIKeyError(error_message)
-            case 404:
-                raise NotFoundError(error_message)
-            case 429:
-                raise TooManyRequestsError(error_message)
-            case _:
-                raise OpenWeatherMapException(error_message)
-
-
-async def _make_get_request_async(url, json: bool = True) -> dict | str | bytes:
+            async with session.get(url, params=params, headers=headers, timeout=client_timeout) as response:
+                content = await response.read()
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if attempt == _RETRIES:
+                raise
+            delay = _retry_delay(None, attempt)
+        else:
+            if response.status not in _RETRY_STATUSES or attempt == _RETRIES:
+                return response, content
+            delay = _retry_delay(response.headers.get('Retry-After'), attempt)
+            if delay > _MAX_RETRY_DELAY:
+                return response, content
+        await asyncio.sleep(delay)
+
+async def _make_get_request_async(url, json: bool = True, session: "aiohttp.ClientSession | None" = None, error_map: dict[int, type[OpenWeatherMapException]] = _ERROR_MAP, limiter: _RateLimiter | None = None, params: dict | None = None, timeout: tuple[float, float] = (3.05, 10.0)) -> dict | str | bytes:
     """
     Make an asynchronous GET request to the specified URL.
 
     Args:
         url (str): The URL to send the GET request to.
         json (bool): If True, the response will be parsed as JSON. If False, the raw response text or bytes will be returned.
+        session (aiohttp.ClientSession | None): The session to send the request with. If None, a temporary session is used for this request only.
+        error_map (dict[int, type[OpenWeatherMapException]]): Mapping of status codes to the exceptions to raise for them.
+        limiter (_RateLimiter | None): Rate limiter to wait for before sending the request.
+        params (dict | None): The query parameters to include in the GET request.
+        timeout (tuple[float, float]): Connect and read timeouts in seconds.
 
     Returns:
         dict: The JSON-decoded response data.
@@ -65,29 +521,64 @@ async def _make_get_request_async(url, json: bool = True) -> dict | str | bytes:
         TooManyRequestsError: If the API rate limit is exceeded.
         OpenWeatherMapException: For internal server errors (500, 502, 503, 504).
     """
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url) as response:
-            if response.status == 200:
-                if json:
-                    return await response.json()
-                else:
-                    try:
-                        return await response.text()
-                    except UnicodeDecodeError: # Return raw bytes if text decoding fails
-                        return await response.read()
-            else:
-                try:
-                    error_message = await response.json()
-                except Exception:
-                    error_message = await response.text()
-                match response.status:
-                    case 400000:
-                        raise SubscriptionLevelError(error_message)
-                    case 401:
-                        raise InvalidAPIKeyError(error_message)
-                    case 404:
-                        raise NotFoundError(error_message)
-                    case 429:
-                        raise TooManyRequestsError(error_message)
-                    case _:
-                        raise OpenWeatherMapException(error_message)
\ No newline at end of file
+    if session is None:
+        async with _create_async_session() as session:
+            return await _make_get_request_async(url, json, session, error_map, limiter, params, timeout)
+    response, content = await _send_async(session, url, params, None, limiter, timeout)
+    _raise_for_status(response.status, content, error_map)
+    if json:
+        return _json.loads(content)
+    else:
+        try:
+            return content.decode(response.charset or 'utf-8')
+        except (UnicodeDecodeError, LookupError): # Return raw bytes if text decoding fails
+            return content
+
+async def _make_cached_get_request_async(url: str, params: dict, expire: float | None, tag: str, session: "aiohttp.ClientSession", error_map: dict[int, type[OpenWeatherMapException]] = _ERROR_MAP, limiter: _RateLimiter | None = None, timeout: tuple[float, float] = (3.05, 10.0), use_cache: bool = False) -> dict | list:
+    """
+    Make an asynchronous GET request and return the decoded JSON, serving repeated requests from the response cache.
+
+    Uses the same cache and expiry policy as `_make_cached_get_request`, so cached responses are shared between the synchronous and asynchronous wrappers.
+
+    Args:
+        url (str): The URL to send the GET request to.
+        params (dict): The query parameters to include in the GET request.
+        expire (float | None): Seconds after which the cached response expires. None means the response never expires.
+        tag (str): Tag to store the cached response under, usually the name of the endpoint.
+        session (aiohttp.ClientSession): The session to send the request with.
+        error_map (dict[int, type[OpenWeatherMapException]]): Mapping of status codes to the exceptions to raise for them.
+        limiter (_RateLimiter | None): Rate limiter to wait for before sending a request. Cache hits are not limited.
+        timeout (tuple[float, float]): Connect and read timeouts in seconds.
+        use_cache (bool): If False, the on-disk response cache is not used.
+
+    Returns:
+        dict | list: The JSON response from the server.
+
+    Raises:
+        SubscriptionLevelError: If the API key does not have access to the requested data.
+        InvalidAPIKeyError: If the API key is invalid.
+        NotFoundError: If the location is not found.
+        TooManyRequestsError: If the API rate limit is exceeded.
+        OpenWeatherMapException: For internal server errors (500, 502, 503, 504).
+    """
+    key = _cache_key(tag, url, params)
+    if expire is None and (data := _immutable_responses.get(key)) is not None:
+        return data
+    response_cache = _get_cache() if use_cache else None
+    if response_cache is None:
+        data = await _make_get_request_async(url, True, session, error_map, limiter, params, timeout)
+    elif (entry := response_cache.get(key)) is not None and _is_fresh(entry):
+        data = entry[3]
+    else:
+        response, content = await _send_async(session, url, params, _revalidation_headers(entry), limiter, timeout)
+        _raise_for_status(response.status, content, error_map)
+        if response.status == 304:
+            _, etag, last_modified, data = entry
+        else:
+            data = _json.loads(content)
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+        _store_cached(response_cache, key, expire, tag, etag, last_modified, data)
+    if expire is None:
+        _immutable_responses.set(key, data)
+    return data
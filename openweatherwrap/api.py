@@ -5,24 +5,32 @@ These classes are designed to be used with the corresponding OpenWeatherMap API
 Example:
     If you want to use the One Call API, you can create an instance of the OneCallAPI class.
 """
-import requests
+import importlib.util
+import sys
+import time
 
-from typing import Literal
-from geopy.geocoders import Nominatim
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, ClassVar, Literal
 
-from openweatherwrap._utils import _make_get_request
+from openweatherwrap import _utils
+from openweatherwrap._utils import _ERROR_MAP, _geocode, _get_rate_limiter, _make_cached_get_request, _make_get_request, _parse
 
 from .core import AirPollutionResponse, CurrentWeatherResponse, GeocodingResponse, OneCallResponse, FiveDayForecastResponse, OneCallTimestampedResponse, OneCallAggregationResponse
 
 from .errors import *
 
+if TYPE_CHECKING:
+    import requests
+
 class OpenWeatherMapAPI:
     """
     Base class for OpenWeatherMap API wrappers.
 
     This class does not make any API calls itself, but provides common functionality for all OpenWeatherMap API wrappers.
     """
-    def __init__(self, api_key: str, location: str | tuple, language: str='en', units: Literal['standard', 'metric', 'imperial'] = 'standard') -> None:
+    _ERROR_MAP: ClassVar[dict[int, type[OpenWeatherMapException]]] = _ERROR_MAP
+
+    def __init__(self, api_key: str, location: str | tuple, language: str='en', units: Literal['standard', 'metric', 'imperial'] = 'standard', rate_limit: tuple[int, float] | None = None, timeout: tuple[float, float] = (3.05, 10.0), cache: bool = False) -> None:
         """
         Base class for the OpenWeatherMap API wrapper.
 
@@ -31,45 +39,101 @@ class OpenWeatherMapAPI:
             location (str | tuple): Location as a string (city name) or a tuple (latitude, longitude).
             language (str, optional): Language for the API response (e.g., 'en', 'fr'). Defaults to 'en'.
             units (Literal['standard', 'metric', 'imperial'], optional): Units for temperature ('standard', 'metric', 'imperial'). Defaults to 'standard'.
+            rate_limit (tuple[int, float] | None, optional): Maximum number of requests per period in seconds, e.g. (60, 60.0) for the free plan. Requests over the limit wait until they are allowed. Defaults to None (no limit).
+            timeout (tuple[float, float], optional): Connect and read timeouts for each request in seconds. Defaults to (3.05, 10.0).
+            cache (bool, optional): Cache responses on disk in `~/.cache/openweatherwrap`, each endpoint with its own expiry time. Requires the optional `diskcache` dependency. Defaults to False.
 
         Raises:
+            ImportError: If `cache` is True but `diskcache` is not installed.
+            ValueError: If `rate_limit` does not allow at least one request in a period longer than 0 seconds.
             ValueError: If the location is not found when a string is provided.
             ValueError: If the location tuple is not valid (not a tuple of two floats or ints).
             ValueError: If the latitude is not between -90 and 90, and longitude is not between -180 and 180.
         """
         self.api_key = api_key
         self.location = location
-        self.language = language
-        self.units = units
+        self.language = sys.intern(language)
+        self.units = sys.intern(units)
+        if rate_limit is not None:
+            calls, period = rate_limit
+            if not (calls >= 1 and period > 0):
+                raise ValueError("Rate limit must allow at least 1 call per period, and the period must be longer than 0 seconds.")
+        self._limiter = _get_rate_limiter(api_key, *rate_limit) if rate_limit else None
+        self._timeout = timeout
+        if cache and importlib.util.find_spec('diskcache') is None:
+            raise ImportError("cache=True requires diskcache, install it with 'pip install openweatherwrap[cache]'.")
+        self._cache = cache
 
         if not isinstance(location, tuple):
             # Convert string location to tuple using geopy
-            geolocator = Nominatim(user_agent="openweatherwrap")
-            location_data = geolocator.geocode(location)
-            if location_data:
-                self.location = (location_data.latitude, location_data.longitude)
-            else:
-                raise ValueError("Location not found. Please provide a valid location.")
+            self.location = _geocode(location)
         else:
-            if len(location) != 2 or not all(isinstance(coord, (int, float)) for coord in location):
+            if len(location) != 2:
                 raise ValueError("Location must be a tuple of (latitude, longitude).")
-            else:
-                if not (-90 <= location[0] <= 90 and -180 <= location[1] <= 180):
-                    raise ValueError("Latitude must be between -90 and 90, and longitude must be between -180 and 180.")
+            latitude, longitude = location
+            if not (isinstance(latitude, (int, float)) and isinstance(longitude, (int, float))):
+                raise ValueError("Location must be a tuple of (latitude, longitude).")
+            if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+                raise ValueError("Latitude must be between -90 and 90, and longitude must be between -180 and 180.")
+            self.location = (float(latitude), float(longitude))
 
     def __str__(self) -> str:
         """
         Returns a string representation of the API instance.
 
+        Only the last four characters of the API key are shown, so the key does not end up in logs.
+
         Returns:
             str: String representation of the API instance.
         """
-        return f"{self.__class__.__name__}(api_key={self.api_key}, location={self.location}, language={self.language}, units={self.units})"
+        return f"{self.__class__.__name__}(api_key=...{self.api_key[-4:]}, location={self.location}, language={self.language}, units={self.units})"
+
+    def _get(self, url: str, params: dict | None = None) -> "requests.Response":
+        """
+        Sends a GET request to the API, raising the exception from `_ERROR_MAP` matching the status code on failure.
+
+        Args:
+            url (str): The URL to send the GET request to.
+            params (dict | None, optional): The query parameters to include in the request.
+
+        Returns:
+            requests.Response: The successful response.
+        """
+        return _make_get_request(url, params, self._ERROR_MAP, limiter=self._limiter, timeout=self._timeout)
+
+    def _get_cached(self, url: str, params: dict, expire: float | None, tag: str) -> dict | list:
+        """
+        Sends a GET request to the API and returns the decoded JSON, using the response cache if it is enabled.
+
+        Args:
+            url (str): The URL to send the GET request to.
+            params (dict): The query parameters to include in the request.
+            expire (float | None): Seconds after which the cached response expires. None means it never expires.
+            tag (str): Tag to store the cached response under.
+
+        Returns:
+            dict | list: The decoded JSON response.
+        """
+        return _make_cached_get_request(url, params, expire, tag, self._ERROR_MAP, self._limiter, self._timeout, self._cache)
+
+    def close(self) -> None:
+        """
+        Closes the pooled HTTP connections used for synchronous requests.
+
+        The connection pool is shared between all synchronous API instances in the process, so this affects every instance, including requests currently running in other threads.
+        Only call it when no other requests are being made, e.g. at shutdown. The pool is transparently reopened on the next request.
+        """
+        _utils._close_session()
 
 
 class OneCallAPI(OpenWeatherMapAPI):
     """Wrapper for the One Call API from OpenWeatherMap."""
-    def __init__(self, api_key: str, location: str | tuple, language: str = 'en', units: Literal['standard', 'metric', 'imperial'] = 'standard') -> None:
+    _URL: ClassVar[str] = "https://api.openweathermap.org/data/3.0/onecall"
+    _URL_TIMEMACHINE: ClassVar[str] = _URL + "/timemachine"
+    _URL_SUMMARY: ClassVar[str] = _URL + "/day_summary"
+    _URL_OVERVIEW: ClassVar[str] = _URL + "/overview"
+
+    def __init__(self, api_key: str, location: str | tuple, language: str = 'en', units: Literal['standard', 'metric', 'imperial'] = 'standard', rate_limit: tuple[int, float] | None = None, timeout: tuple[float, float] = (3.05, 10.0), cache: bool = False) -> None:
         """
         Initializes the OneCall API wrapper.
 
@@ -80,21 +144,27 @@ class OneCallAPI(OpenWeatherMapAPI):
             location (str | tuple): Location as a string (city name) or a tuple (latitude, longitude).
             language (str, optional): Language for the API response (default is 'en').
             units (Literal['standard', 'metric', 'imperial'], optional): Units for temperature ('standard', 'metric', 'imperial').
+            rate_limit (tuple[int, float] | None, optional): Maximum number of requests per period in seconds, e.g. (60, 60.0) for the free plan. Requests over the limit wait until they are allowed. Defaults to None (no limit).
+            timeout (tuple[float, float], optional): Connect and read timeouts for each request in seconds. Defaults to (3.05, 10.0).
+            cache (bool, optional): Cache responses on disk in `~/.cache/openweatherwrap`, each endpoint with its own expiry time. Requires the optional `diskcache` dependency. Defaults to False.
 
         Raises:
             ValueError: If the location is not found when a string is provided.
             ValueError: If the location tuple is not valid (not a tuple of two floats or ints).
             ValueError: If the latitude is not between -90 and 90, and longitude is not between -180 and 180.
         """
-        super().__init__(api_key, location, language, units)
+        super().__init__(api_key, location, language, units, rate_limit=rate_limit, timeout=timeout, cache=cache)
 
-        self.url = "https://api.openweathermap.org/data/3.0/onecall?lat={lat}&lon={lon}&appid={key}&lang={lang}&units={units}".format(
-            lat=self.location[0],
-            lon=self.location[1],
-            key=self.api_key,
-            lang=self.language,
-            units=self.units
-        )
+        self.url = self._URL
+        self._params = {
+            'lat': self.location[0],
+            'lon': self.location[1],
+            'appid': self.api_key,
+            'lang': self.language,
+            'units': self.units
+        }
+        # The overview endpoint does not support the lang parameter
+        self._overview_params = {key: value for key, value in self._params.items() if key != 'lang'}
 
     def get_weather(self, exclude: list[Literal['current', 'minutely', 'hourly', 'daily', 'alerts']] = []) -> OneCallResponse:
         """
@@ -114,13 +184,8 @@ class OneCallAPI(OpenWeatherMapAPI):
             TooManyRequestsError: If the API rate limit is exceeded.
             OpenWeatherMapException: For internal server errors (500, 502, 503, 504).
         """
-        exclude_str = ','.join(exclude) if exclude else ''
-        if exclude_str:
-            url = self.url + f"&exclude={exclude_str}"
-        else:
-            url = self.url
-        response = _make_get_request(url)
-        return OneCallResponse(response.json())
+        params = {**self._params, 'exclude': ','.join(exclude)} if exclude else self._params
+        return OneCallResponse(self._get_cached(self.url, params, expire=600, tag='onecall'))
 
     def get_timed_weather(self, timestamp: int) -> OneCallTimestampedResponse:
         """
@@ -144,9 +209,10 @@ class OneCallAPI(OpenWeatherMapAPI):
         """
         if timestamp < 283996800:  # January 1, 1979
             raise ValueError("Timestamp must be greater than or equal to January 1, 1979 (283996800).")
-        url = f"{self.url.replace('onecall?', 'onecall/timemachine?')}&dt={timestamp}"
-        response = _make_get_request(url)
-        return OneCallTimestampedResponse(response.json())
+        params = {**self._params, 'dt': timestamp}
+        # Historical data does not change anymore, so it can be cached indefinitely
+        expire = None if timestamp < time.time() - 3600 else 600
+        return OneCallTimestampedResponse(self._get_cached(self._URL_TIMEMACHINE, params, expire=expire, tag='timemachine'))
 
     def get_aggregation(self, date: str) -> OneCallAggregationResponse:
         """
@@ -167,9 +233,8 @@ class OneCallAPI(OpenWeatherMapAPI):
 
         .. _ISO 8601: https://en.wikipedia.org/wiki/ISO_8601
         """
-        url = f"{self.url.replace('onecall?', 'onecall/day_summary?')}&date={date}"
-        response = _make_get_request(url)
-        return OneCallAggregationResponse(response.json())
+        params = {**self._params, 'date': date}
+        return OneCallAggregationResponse(self._get_cached(self._URL_SUMMARY, params, expire=86400, tag='day_summary'))
 
     def get_overview(self) -> str:
         """
@@ -185,13 +250,13 @@ class OneCallAPI(OpenWeatherMapAPI):
             TooManyRequestsError: If the API rate limit is exceeded.
             OpenWeatherMapException: For internal server errors (500, 502, 503, 504).
         """
-        url = f"{self.url.replace('onecall?', 'onecall/overview?').replace(f'&lang={self.language}', '')}"
-        response = _make_get_request(url)
-        return response.json().get('weather_overview', 'No overview available.')
+        return self._get_cached(self._URL_OVERVIEW, self._overview_params, expire=3600, tag='overview').get('weather_overview', 'No overview available.')
 
 class CurrentWeatherAPI(OpenWeatherMapAPI):
     """Wrapper for the Current Weather Data API from OpenWeatherMap."""
-    def __init__(self, api_key: str, location: str | tuple, language: str = 'en', units: Literal['standard', 'metric', 'imperial'] = 'standard', mode: Literal['xml', 'html', 'json']='json') -> None:
+    _URL: ClassVar[str] = "https://api.openweathermap.org/data/2.5/weather"
+
+    def __init__(self, api_key: str, location: str | tuple, language: str = 'en', units: Literal['standard', 'metric', 'imperial'] = 'standard', mode: Literal['xml', 'html', 'json']='json', rate_limit: tuple[int, float] | None = None, timeout: tuple[float, float] = (3.05, 10.0), cache: bool = False) -> None:
         """
         Initializes the CurrentWeatherData API wrapper.
 
@@ -201,6 +266,9 @@ class CurrentWeatherAPI(OpenWeatherMapAPI):
             language (str, optional): Language for the API response (default is 'en').
             units (Literal['standard', 'metric', 'imperial'], optional): Units for temperature ('standard', 'metric', 'imperial').
             mode (Literal['xml', 'html', 'json'], optional): Response format ('xml', 'html', or 'json'). Defaults to 'json'.
+            rate_limit (tuple[int, float] | None, optional): Maximum number of requests per period in seconds, e.g. (60, 60.0) for the free plan. Requests over the limit wait until they are allowed. Defaults to None (no limit).
+            timeout (tuple[float, float], optional): Connect and read timeouts for each request in seconds. Defaults to (3.05, 10.0).
+            cache (bool, optional): Cache responses on disk in `~/.cache/openweatherwrap`, each endpoint with its own expiry time. Requires the optional `diskcache` dependency. Defaults to False.
 
         Raises:
             ValueError: If the location is not found when a string is provided.
@@ -208,18 +276,19 @@ class CurrentWeatherAPI(OpenWeatherMapAPI):
             ValueError: If the latitude is not between -90 and 90, and longitude is not between -180 and 180.
             ValueError: If the mode is not 'xml', 'html', or 'json'.
         """
-        super().__init__(api_key, location, language, units)
-        self.mode = mode
-        if self.mode not in ['xml', 'html', 'json']:
+        super().__init__(api_key, location, language, units, rate_limit=rate_limit, timeout=timeout, cache=cache)
+        if mode not in ['xml', 'html', 'json']:
             raise ValueError("Mode must be either 'xml' or 'html' or 'json.")
-        self.url = "https://api.openweathermap.org/data/2.5/weather?lat={lat}&lon={lon}&appid={key}&lang={lang}&units={units}&mode={mode}".format(
-            lat=self.location[0],
-            lon=self.location[1],
-            key=self.api_key,
-            lang=self.language,
-            units=self.units,
-            mode=self.mode
-        )
+        self.mode = sys.intern(mode)
+        self.url = self._URL
+        self._params = {
+            'lat': self.location[0],
+            'lon': self.location[1],
+            'appid': self.api_key,
+            'lang': self.language,
+            'units': self.units,
+            'mode': self.mode
+        }
 
     def get_weather(self) -> str | CurrentWeatherResponse:
         """
@@ -235,17 +304,19 @@ class CurrentWeatherAPI(OpenWeatherMapAPI):
             TooManyRequestsError: If the API rate limit is exceeded.
             OpenWeatherMapException: For internal server errors (500, 502, 503, 504).
         """
-        response = _make_get_request(self.url)
+        if self.mode == 'json':
+            return CurrentWeatherResponse(self._get_cached(self.url, self._params, expire=600, tag='weather'), self.mode)
+        response = self._get(self.url, self._params)
         if self.mode == 'html':
             return response.text
-        elif self.mode == 'xml':
-            return CurrentWeatherResponse(response.content, self.mode)
         else:
-            return CurrentWeatherResponse(response.json(), self.mode)
+            return CurrentWeatherResponse(response.content, self.mode)
 
 class FiveDayForecast(OpenWeatherMapAPI):
     """Fetches the 5-day / 3-hour weather forecast from OpenWeatherMap."""
-    def __init__(self, api_key: str, location: str | tuple, count: int = -1, language: str = 'en', units: Literal['standard', 'metric', 'imperial'] = 'standard', mode:Literal['json', 'xml']='json') -> None:
+    _URL: ClassVar[str] = "https://api.openweathermap.org/data/2.5/forecast"
+
+    def __init__(self, api_key: str, location: str | tuple, count: int = -1, language: str = 'en', units: Literal['standard', 'metric', 'imperial'] = 'standard', mode:Literal['json', 'xml']='json', rate_limit: tuple[int, float] | None = None, timeout: tuple[float, float] = (3.05, 10.0), cache: bool = False) -> None:
         """
         Initializes the FiveDayForecast API wrapper.
 
@@ -256,6 +327,9 @@ class FiveDayForecast(OpenWeatherMapAPI):
             language (str, optional): Language for the API response (default is 'en').
             units (Literal['standard', 'metric', 'imperial'], optional): Units for temperature ('standard', 'metric', 'imperial').
             mode (Literal['json', 'xml'], optional): Response format ('xml' or 'json'). Defaults to 'json'.
+            rate_limit (tuple[int, float] | None, optional): Maximum number of requests per period in seconds, e.g. (60, 60.0) for the free plan. Requests over the limit wait until they are allowed. Defaults to None (no limit).
+            timeout (tuple[float, float], optional): Connect and read timeouts for each request in seconds. Defaults to (3.05, 10.0).
+            cache (bool, optional): Cache responses on disk in `~/.cache/openweatherwrap`, each endpoint with its own expiry time. Requires the optional `diskcache` dependency. Defaults to False.
 
         Raises:
             ValueError: If the location is not found when a string is provided.
@@ -263,21 +337,22 @@ class FiveDayForecast(OpenWeatherMapAPI):
             ValueError: If the latitude is not between -90 and 90, and longitude is not between -180 and 180.
             ValueError: If the mode is not 'xml' or 'json'.
         """
-        super().__init__(api_key, location, language, units)
-        self.mode = mode
-        self.count = count
-        if self.mode not in ['xml', 'json']:
+        super().__init__(api_key, location, language, units, rate_limit=rate_limit, timeout=timeout, cache=cache)
+        if mode not in ['xml', 'json']:
             raise ValueError("Mode must be either 'xml' or 'json'.")
-        self.url = "https://api.openweathermap.org/data/2.5/forecast?lat={lat}&lon={lon}&appid={key}&lang={lang}&units={units}&mode={mode}".format(
-            lat=self.location[0],
-            lon=self.location[1],
-            key=self.api_key,
-            lang=self.language,
-            units=self.units,
-            mode=self.mode
-        )
+        self.mode = sys.intern(mode)
+        self.count = count
+        self.url = self._URL
+        self._params = {
+            'lat': self.location[0],
+            'lon': self.location[1],
+            'appid': self.api_key,
+            'lang': self.language,
+            'units': self.units,
+            'mode': self.mode
+        }
         if self.count > 0:
-            self.url += f"&cnt={self.count}"
+            self._params['cnt'] = self.count
 
     def get_forecast(self) -> FiveDayForecastResponse:
         """
@@ -293,33 +368,40 @@ class FiveDayForecast(OpenWeatherMapAPI):
             TooManyRequestsError: If the API rate limit is exceeded.
             OpenWeatherMapException: For internal server errors (500, 502, 503, 504).
         """
-        response = _make_get_request(self.url)
-        if self.mode == 'xml':
-            return FiveDayForecastResponse(response.content, self.mode)
-        else:
-            return FiveDayForecastResponse(response.json(), self.mode)
+        if self.mode == 'json':
+            return FiveDayForecastResponse(self._get_cached(self.url, self._params, expire=600, tag='forecast'), self.mode)
+        response = self._get(self.url, self._params)
+        return FiveDayForecastResponse(response.content, self.mode)
 
 class AirPollutionAPI(OpenWeatherMapAPI):
     """Wrapper for the Air Pollution API from OpenWeatherMap."""
-    def __init__(self, api_key: str, location: str | tuple) -> None:
+    _URL: ClassVar[str] = "https://api.openweathermap.org/data/2.5/air_pollution"
+    _URL_FORECAST: ClassVar[str] = _URL + "/forecast"
+    _URL_HISTORY: ClassVar[str] = _URL + "/history"
+
+    def __init__(self, api_key: str, location: str | tuple, rate_limit: tuple[int, float] | None = None, timeout: tuple[float, float] = (3.05, 10.0), cache: bool = False) -> None:
         """
         Initializes the AirPollution API wrapper.
 
         Args:
             api_key (str): Your OpenWeatherMap API key.
             location (str | tuple): Location as a string (city name) or a tuple (latitude, longitude).
+            rate_limit (tuple[int, float] | None, optional): Maximum number of requests per period in seconds, e.g. (60, 60.0) for the free plan. Requests over the limit wait until they are allowed. Defaults to None (no limit).
+            timeout (tuple[float, float], optional): Connect and read timeouts for each request in seconds. Defaults to (3.05, 10.0).
+            cache (bool, optional): Cache responses on disk in `~/.cache/openweatherwrap`, each endpoint with its own expiry time. Requires the optional `diskcache` dependency. Defaults to False.
 
         Raises:
             ValueError: If the location is not found when a string is provided.
             ValueError: If the location tuple is not valid (not a tuple of two floats or ints).
             ValueError: If the latitude is not between -90 and 90, and longitude is not between -180 and 180.
         """
-        super().__init__(api_key, location)
-        self.url = "https://api.openweathermap.org/data/2.5/air_pollution?lat={lat}&lon={lon}&appid={key}".format(
-            lat=self.location[0],
-            lon=self.location[1],
-            key=self.api_key,
-        )
+        super().__init__(api_key, location, rate_limit=rate_limit, timeout=timeout, cache=cache)
+        self.url = self._URL
+        self._params = {
+            'lat': self.location[0],
+            'lon': self.location[1],
+            'appid': self.api_key
+        }
 
     def get_current_air_pollution(self) -> AirPollutionResponse:
         """
@@ -335,8 +417,7 @@ class AirPollutionAPI(OpenWeatherMapAPI):
             TooManyRequestsError: If the API rate limit is exceeded.
             OpenWeatherMapException: For internal server errors (500, 502, 503, 504).
         """
-        response = _make_get_request(self.url)
-        return AirPollutionResponse(response.json())
+        return AirPollutionResponse(self._get_cached(self.url, self._params, expire=60, tag='air_pollution'))
 
     def get_air_pollution_forecast(self) -> AirPollutionResponse:
         """
@@ -352,9 +433,8 @@ class AirPollutionAPI(OpenWeatherMapAPI):
             TooManyRequestsError: If the API rate limit is exceeded.
             OpenWeatherMapException: For internal server errors (500, 502, 503, 504).
         """
-        url = f"{self.url.replace('air_pollution?', 'air_pollution/forecast?')}"
-        response = _make_get_request(url)
-        return AirPollutionResponse(response.json())
+        response = self._get(self._URL_FORECAST, self._params)
+        return AirPollutionResponse(_parse(response))
 
     def get_air_pollution_history(self, start: int, end: int) -> AirPollutionResponse:
         """
@@ -374,23 +454,30 @@ class AirPollutionAPI(OpenWeatherMapAPI):
             TooManyRequestsError: If the API rate limit is exceeded.
             OpenWeatherMapException: For internal server errors (500, 502, 503, 504).
         """
-        url = f"{self.url.replace('air_pollution?', 'air_pollution/history?')}&start={start}&end={end}"
-        response = _make_get_request(url)
-        return GeocodingResponse(response.json())
+        response = self._get(self._URL_HISTORY, {**self._params, 'start': start, 'end': end})
+        return AirPollutionResponse(_parse(response))
 
 class GeocodingAPI(OpenWeatherMapAPI):
     """Wrapper for the Geocoding API from OpenWeatherMap."""
-    def __init__(self, api_key: str) -> None:
+    # Malformed geocoding queries are answered with HTTP 400 instead of 404
+    _ERROR_MAP: ClassVar[dict[int, type[OpenWeatherMapException]]] = {**_ERROR_MAP, 400: NotFoundError}
+    _URL: ClassVar[str] = "https://api.openweathermap.org/geo/1.0/direct"
+    _URL_ZIP: ClassVar[str] = "https://api.openweathermap.org/geo/1.0/zip"
+    _URL_REVERSE: ClassVar[str] = "https://api.openweathermap.org/geo/1.0/reverse"
+
+    def __init__(self, api_key: str, rate_limit: tuple[int, float] | None = None, timeout: tuple[float, float] = (3.05, 10.0), cache: bool = False) -> None:
         """
         Initializes the Geocoding API wrapper.
 
         Args:
             api_key (str): Your OpenWeatherMap API key.
+            rate_limit (tuple[int, float] | None, optional): Maximum number of requests per period in seconds, e.g. (60, 60.0) for the free plan. Requests over the limit wait until they are allowed. Defaults to None (no limit).
+            timeout (tuple[float, float], optional): Connect and read timeouts for each request in seconds. Defaults to (3.05, 10.0).
+            cache (bool, optional): Cache responses on disk in `~/.cache/openweatherwrap`, each endpoint with its own expiry time. Requires the optional `diskcache` dependency. Defaults to False.
         """
-        super().__init__(api_key, (0.0, 0.0))
-        self.url = "https://api.openweathermap.org/geo/1.0/direct?&appid={key}".format(
-            key=self.api_key
-        )
+        super().__init__(api_key, (0.0, 0.0), rate_limit=rate_limit, timeout=timeout, cache=cache)
+        self.url = self._URL
+        self._params = {'appid': self.api_key}
 
     def get_by_city(self, city: str, country: str, state_code = None, limit=1) -> GeocodingResponse:
         """
@@ -419,12 +506,32 @@ class GeocodingAPI(OpenWeatherMapAPI):
         """
         if limit > 5 or limit < 1:
             raise ValueError("Limit must be between 1 and 5.")
-        url = f"{self.url}&q={city},{country}"
-        if state_code:
-            url += f",{state_code}"
-        url += f"&limit={limit}"
-        response = _make_get_request(url)
-        return GeocodingResponse(response.json())
+        query = f"{city},{state_code},{country}" if state_code else f"{city},{country}"
+        # Coordinates of places practically never change, so geocoding results are cached indefinitely
+        return GeocodingResponse(self._get_cached(self.url, {**self._params, 'q': query, 'limit': limit}, expire=None, tag='geocoding'))
+
+    def get_by_cities(self, queries: list[tuple]) -> list[GeocodingResponse]:
+        """
+        Fetches the geocoding data for several cities concurrently and returns the responses.
+
+        The requests are sent from a small thread pool and share the pooled connections, so the total time is close to that of the slowest request instead of the sum of all requests.
+
+        Args:
+            queries (list[tuple]): The arguments of `get_by_city` for each city, e.g. `[("London", "GB"), ("Springfield", "US", "IL")]`.
+
+        Returns:
+            list[GeocodingResponse]: The responses, in the same order as the queries.
+
+        Raises:
+            ValueError: If limit > 5 or limit < 1 for any query.
+            SubscriptionLevelError: If the API key does not have access to the requested data.
+            InvalidAPIKeyError: If the API key is invalid.
+            NotFoundError: If the location is not found.
+            TooManyRequestsError: If the API rate limit is exceeded.
+            OpenWeatherMapException: For internal server errors (500, 502, 503, 504).
+        """
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            return list(executor.map(lambda query: self.get_by_city(*query), queries))
 
     def get_by_zip(self, zip_code: str, country: str) -> GeocodingResponse:
         """
@@ -446,9 +553,7 @@ class GeocodingAPI(OpenWeatherMapAPI):
 
         .. _ISO 3166-1 alpha-2: https://en.wikipedia.org/wiki/ISO_3166-1_alpha-2
         """
-        url = f"{self.url.replace("direct?", "zip?")}&zip={zip_code},{country}"
-        response = _make_get_request(url)
-        return GeocodingResponse(response.json())
+        return GeocodingResponse(self._get_cached(self._URL_ZIP, {**self._params, 'zip': f"{zip_code},{country}"}, expire=None, tag='geocoding'))
 
     def get_by_coordinates(self, latitude: float, longitude: float, limit: int = 1) -> GeocodingResponse:
         """
@@ -475,25 +580,27 @@ class GeocodingAPI(OpenWeatherMapAPI):
             raise ValueError("Limit must be between 1 and 5.")
         if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
             raise ValueError("Latitude must be between -90 and 90, and longitude must be between -180 and 180.")
-        url = f"{self.url}&lat={latitude}&lon={longitude}&limit={limit}"
-        url = url.replace('direct?', 'reverse?')
-        response = _make_get_request(url)
-        return GeocodingResponse(response.json())
+        # Round to about 11 m, so lookups of nearly the same point share one cache entry
+        return GeocodingResponse(self._get_cached(self._URL_REVERSE, {**self._params, 'lat': round(latitude, 4), 'lon': round(longitude, 4), 'limit': limit}, expire=None, tag='geocoding'))
 
 class WeatherMapsAPI(OpenWeatherMapAPI):
     """Wrapper for the Weather Map API from OpenWeatherMap."""
-    def __init__(self, api_key: str) -> None:
+    _URL: ClassVar[str] = "https://tile.openweathermap.org/map"
+
+    def __init__(self, api_key: str, rate_limit: tuple[int, float] | None = None, timeout: tuple[float, float] = (3.05, 10.0), cache: bool = False) -> None:
         """
         Initializes the Weather Map API wrapper.
 
         Args:
             api_key (str): Your OpenWeatherMap API key.
+            rate_limit (tuple[int, float] | None, optional): Maximum number of requests per period in seconds, e.g. (60, 60.0) for the free plan. Requests over the limit wait until they are allowed. Defaults to None (no limit).
+            timeout (tuple[float, float], optional): Connect and read timeouts for each request in seconds. Defaults to (3.05, 10.0).
+            cache (bool, optional): Cache responses on disk in `~/.cache/openweatherwrap`, each endpoint with its own expiry time. Requires the optional `diskcache` dependency. Defaults to False.
 
         """
-        super().__init__(api_key, (0.0, 0.0))
-        self.url = "https://tile.openweathermap.org/map/LAYER/Z/X/Y.png?appid={key}".format(
-            key=self.api_key,
-        )
+        super().__init__(api_key, (0.0, 0.0), rate_limit=rate_limit, timeout=timeout, cache=cache)
+        self.url = self._URL
+        self._params = {'appid': self.api_key}
 
     def get_weathermap(self, layer: Literal["clouds_new", "precipitation_new", "pressure_new", "wind_new", "temp_new", "wind_new"], x: int, y: int, zoom: int) -> bytes:
         """
@@ -539,8 +646,7 @@ class WeatherMapsAPI(OpenWeatherMapAPI):
             raise ValueError("X and Y coordinates must be non-negative integers.")
         if layer not in ["clouds_new", "precipitation_new", "pressure_new", "wind_new", "temp_new", "wind_new"]:
             raise ValueError("Layer must be one of: 'clouds_new', 'precipitation_new', 'pressure_new', 'wind_new', 'temp_new', 'snow_new', 'rain_new'.")
-        url = self.url.replace("LAYER", layer).replace("X", str(x)).replace("Y", str(y)).replace("Z", str(zoom))
-        response = _make_get_request(url)
+        response = self._get(f"{self.url}/{layer}/{zoom}/{x}/{y}.png", self._params)
         return response.content
 
     def download_weathermap(self, layer: Literal["clouds_new", "precipitation_new", "pressure_new", "wind_new", "temp_new", "snow_new", "rain_new"], x: int, y: int, zoom: int, filename: str) -> None:
@@ -5,20 +5,114 @@ These classes are designed to be used with the corresponding OpenWeatherMap API
 Example:
     If you want to use the One Call API, you can create an instance of the OneCallAPI class.
 """
-from openweatherwrap._utils import _make_get_request_async
+from openweatherwrap._utils import _create_async_session, _make_cached_get_request_async, _make_get_request_async
 from .api import *
 
+import sys
+import time
+import asyncio
 import aiohttp
 
 from .core import OneCallAggregationResponse, OneCallResponse, OneCallTimestampedResponse, CurrentWeatherResponse, FiveDayForecastResponse, AirPollutionResponse, GeocodingResponse
 
-class OneCallAPI(OpenWeatherMapAPI):
+class AsyncOpenWeatherMapAPI(OpenWeatherMapAPI):
+    """
+    Base class for the asynchronous OpenWeatherMap API wrappers.
+
+    All requests made by an instance share one `aiohttp.ClientSession`, so concurrent calls (e.g. with `asyncio.gather`) reuse the same kept-alive connections.
+    The session is created on the first request and should be closed with `close()`, or by using the instance as an async context manager.
+    An existing session can be passed as `session` to share it between several wrappers; it is then left open for the caller to close.
+    """
+    _session: aiohttp.ClientSession | None = None
+
+    def __init__(self, api_key: str, location: str | tuple, language: str = 'en', units: Literal['standard', 'metric', 'imperial'] = 'standard', rate_limit: tuple[int, float] | None = None, timeout: tuple[float, float] = (3.05, 10.0), cache: bool = False, session: aiohttp.ClientSession | None = None) -> None:
+        super().__init__(api_key, location, language, units, rate_limit=rate_limit, timeout=timeout, cache=cache)
+        self._session = session
+        # Sessions passed in by the caller are left open for them to close
+        self._owns_session = session is None
+        # Requests currently in flight, so concurrent identical requests are sent only once
+        self._inflight: dict[tuple, asyncio.Task] = {}
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Returns the session of this instance, creating it if it does not exist yet or was closed.
+
+        Returns:
+            aiohttp.ClientSession: The session to send requests with.
+        """
+        if self._session is None or (self._owns_session and self._session.closed):
+            self._session = _create_async_session()
+            self._owns_session = True
+        return self._session
+
+    async def _get(self, url: str, params: dict | None = None, json: bool = True) -> dict | str | bytes:
+        """
+        Sends a GET request using the session of this instance.
+
+        Args:
+            url (str): The URL to send the GET request to.
+            params (dict | None): The query parameters to include in the request.
+            json (bool): If True, the response will be parsed as JSON. If False, the raw response text or bytes will be returned.
+
+        Returns:
+            dict | str | bytes: The response data.
+
+        Raises:
+            SubscriptionLevelError: If the API key does not have access to the requested data.
+            InvalidAPIKeyError: If the API key is invalid.
+            NotFoundError: If the location is not found.
+            TooManyRequestsError: If the API rate limit is exceeded.
+            OpenWeatherMapException: For internal server errors (500, 502, 503, 504).
+        """
+        return await _make_get_request_async(url, json, self._get_session(), self._ERROR_MAP, self._limiter, params, self._timeout)
+
+    async def _get_cached(self, url: str, params: dict, expire: float | None, tag: str) -> dict | list:
+        """
+        Sends a GET request using the session of this instance and returns the decoded JSON, using the response cache if it is enabled.
+
+        Concurrent calls for the same URL and parameters share a single request instead of each sending their own.
+        Cancelling one of the callers does not cancel the request for the others.
+
+        Args:
+            url (str): The URL to send the GET request to.
+            params (dict): The query parameters to include in the request.
+            expire (float | None): Seconds after which the cached response expires. None means it never expires.
+            tag (str): Tag to store the cached response under.
+
+        Returns:
+            dict | list: The decoded JSON response.
+        """
+        key = (url, tuple(sorted(params.items())))
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(_make_cached_get_request_async(url, params, expire, tag, self._get_session(), self._ERROR_MAP, self._limiter, self._timeout, self._cache))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def close(self) -> None:
+        """Closes the HTTP session of this instance, unless it was passed in by the caller."""
+        if self._session is not None and self._owns_session:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+class OneCallAPI(AsyncOpenWeatherMapAPI):
     """
     Asynchronous class for handling OpenWeatherMap One Call API requests.
     This class is designed to be used with the One Call API endpoint.
     """
+    _URL: ClassVar[str] = "https://api.openweathermap.org/data/3.0/onecall"
+    _URL_TIMEMACHINE: ClassVar[str] = _URL + "/timemachine"
+    _URL_SUMMARY: ClassVar[str] = _URL + "/day_summary"
+    _URL_OVERVIEW: ClassVar[str] = _URL + "/overview"
 
-    def __init__(self, api_key: str, location: str | tuple, language: str = 'en', units: Literal['standard', 'metric', 'imperial'] = 'standard') -> None:
+    def __init__(self, api_key: str, location: str | tuple, language: str = 'en', units: Literal['standard', 'metric', 'imperial'] = 'standard', rate_limit: tuple[int, float] | None = None, timeout: tuple[float, float] = (3.05, 10.0), cache: bool = False, session: aiohttp.ClientSession | None = None) -> None:
         """
         Initializes the OneCall API wrapper.
 
@@ -29,21 +123,28 @@ class OneCallAPI(OpenWeatherMapAPI):
             location (str | tuple): Location as a string (city name) or a tuple (latitude, longitude).
             language (str, optional): Language for the API response (default is 'en').
             units (Literal['standard', 'metric', 'imperial'], optional): Units for temperature ('standard', 'metric', 'imperial').
+            rate_limit (tuple[int, float] | None, optional): Maximum number of requests per period in seconds, e.g. (60, 60.0) for the free plan. Requests over the limit wait until they are allowed. Defaults to None (no limit).
+            timeout (tuple[float, float], optional): Connect and read timeouts for each request in seconds. Defaults to (3.05, 10.0).
+            cache (bool, optional): Cache responses on disk in `~/.cache/openweatherwrap`, each endpoint with its own expiry time. Requires the optional `diskcache` dependency. Defaults to False.
+            session (aiohttp.ClientSession | None, optional): Existing session to send the requests with, e.g. to share one connection pool between several wrappers. It is not closed by `close()`. Defaults to None (the instance creates its own session).
 
         Raises:
             ValueError: If the location is not found when a string is provided.
             ValueError: If the location tuple is not valid (not a tuple of two floats or ints).
             ValueError: If the latitude is not between -90 and 90, and longitude is not between -180 and 180.
         """
-        super().__init__(api_key, location, language, units)
+        super().__init__(api_key, location, language, units, rate_limit=rate_limit, timeout=timeout, cache=cache, session=session)
 
-        self.url = "https://api.openweathermap.org/data/3.0/onecall?lat={lat}&lon={lon}&appid={key}&lang={lang}&units={units}".format(
-            lat=self.location[0],
-            lon=self.location[1],
-            key=self.api_key,
-            lang=self.language,
-            units=self.units
-        )
+        self.url = self._URL
+        self._params = {
+            'lat': self.location[0],
+            'lon': self.location[1],
+            'appid': self.api_key,
+            'lang': self.language,
+            'units': self.units
+        }
+        # The overview endpoint does not support the lang parameter
+        self._overview_params = {key: value for key, value in self._params.items() if key != 'lang'}
 
     async def get_weather(self, exclude: list[Literal['current', 'minutely', 'hourly', 'daily', 'alerts']] = []) -> OneCallResponse:
         """
@@ -63,8 +164,8 @@ class OneCallAPI(OpenWeatherMapAPI):
             TooManyRequestsError: If the API rate limit is exceeded.
             OpenWeatherMapException: For internal server errors (500, 502, 503, 504).
         """
-        url = f"{self.url}&exclude={','.join(exclude)}" if exclude else self.url
-        response = await _make_get_request_async(url)
+        params = {**self._params, 'exclude': ','.join(exclude)} if exclude else self._params
+        response = await self._get_cached(self.url, params, expire=600, tag='onecall')
         return OneCallResponse(response)
 
     async def get_timed_weather(self, timestamp: int) -> OneCallTimestampedResponse:
@@ -90,9 +191,9 @@ class OneCallAPI(OpenWeatherMapAPI):
             raise ValueError("Timestamp must be a positive integer representing seconds since January 1, 1970.")
         if timestamp < 283996800:  # January 1, 1979
             raise ValueError("Timestamp must be greater than or equal to January 1, 1979 (283996800).")
-        url = self.url.replace('onecall?', 'onecall/timemachine?')
-        url += f"&dt={timestamp}"
-        response = await _make_get_request_async(url)
+        # Historical data does not change anymore, so it can be cached indefinitely
+        expire = None if timestamp < time.time() - 3600 else 600
+        response = await self._get_cached(self._URL_TIMEMACHINE, {**self._params, 'dt': timestamp}, expire=expire, tag='timemachine')
         return OneCallTimestampedResponse(response)
 
     async def get_aggregation(self, date: str) -> OneCallAggregationResponse:
@@ -114,9 +215,7 @@ class OneCallAPI(OpenWeatherMapAPI):
 
         .. _ISO 8601: https://en.wikipedia.org/wiki/ISO_8601
         """
-        url = self.url.replace('onecall?', 'onecall/day_summary?')
-        url += f"&date={date}"
-        response = await _make_get_request_async(url)
+        response = await self._get_cached(self._URL_SUMMARY, {**self._params, 'date': date}, expire=86400, tag='day_summary')
         return OneCallAggregationResponse(response)
 
     async def get_overview(self) -> str:
@@ -133,16 +232,17 @@ class OneCallAPI(OpenWeatherMapAPI):
             TooManyRequestsError: If the API rate limit is exceeded.
             OpenWeatherMapException: For internal server errors (500, 502, 503, 504).
         """
-        url = self.url.replace('onecall?', 'onecall/overview?')
-        response = await _make_get_request_async(url, json=True)
+        response = await self._get_cached(self._URL_OVERVIEW, self._overview_params, expire=3600, tag='overview')
         return response.get("weather_overview", "No overview available.")
 
-class CurrentWeatherAPI(OpenWeatherMapAPI):
+class CurrentWeatherAPI(AsyncOpenWeatherMapAPI):
     """
     Asynchronous class for handling OpenWeatherMap Current Weather API requests.
     This class is designed to be used with the Current Weather API endpoint.
     """
-    def __init__(self, api_key: str, location: str | tuple, language: str = 'en', units: Literal['standard', 'metric', 'imperial'] = 'standard', mode: Literal['xml', 'html', 'json']='json') -> None:
+    _URL: ClassVar[str] = "https://api.openweathermap.org/data/2.5/weather"
+
+    def __init__(self, api_key: str, location: str | tuple, language: str = 'en', units: Literal['standard', 'metric', 'imperial'] = 'standard', mode: Literal['xml', 'html', 'json']='json', rate_limit: tuple[int, float] | None = None, timeout: tuple[float, float] = (3.05, 10.0), cache: bool = False, session: aiohttp.ClientSession | None = None) -> None:
         """
         Initializes the CurrentWeatherData API wrapper.
 
@@ -152,6 +252,10 @@ class CurrentWeatherAPI(OpenWeatherMapAPI):
             language (str, optional): Language for the API response (default is 'en').
             units (Literal['standard', 'metric', 'imperial'], optional): Units for temperature ('standard', 'metric', 'imperial').
             mode (Literal['xml', 'html', 'json'], optional): Response format ('xml', 'html', or 'json'). Defaults to 'json'.
+            rate_limit (tuple[int, float] | None, optional): Maximum number of requests per period in seconds, e.g. (60, 60.0) for the free plan. Requests over the limit wait until they are allowed. Defaults to None (no limit).
+            timeout (tuple[float, float], optional): Connect and read timeouts for each request in seconds. Defaults to (3.05, 10.0).
+            cache (bool, optional): Cache responses on disk in `~/.cache/openweatherwrap`, each endpoint with its own expiry time. Requires the optional `diskcache` dependency. Defaults to False.
+            session (aiohttp.ClientSession | None, optional): Existing session to send the requests with, e.g. to share one connection pool between several wrappers. It is not closed by `close()`. Defaults to None (the instance creates its own session).
 
         Raises:
             ValueError: If the location is not found when a string is provided.
@@ -159,20 +263,21 @@ class CurrentWeatherAPI(OpenWeatherMapAPI):
             ValueError: If the latitude is not between -90 and 90, and longitude is not between -180 and 180.
             ValueError: If the mode is not 'xml', 'html', or 'json'.
         """
-        super().__init__(api_key, location, language, units)
+        super().__init__(api_key, location, language, units, rate_limit=rate_limit, timeout=timeout, cache=cache, session=session)
 
         if mode not in ['xml', 'html', 'json']:
             raise ValueError("Mode must be one of 'xml', 'html', or 'json'.")
 
-        self.mode = mode
-        self.url = "https://api.openweathermap.org/data/2.5/weather?lat={lat}&lon={lon}&appid={key}&lang={lang}&units={units}&mode={mode}".format(
-            lat=self.location[0],
-            lon=self.location[1],
-            key=self.api_key,
-            lang=self.language,
-            units=self.units,
-            mode=self.mode
-        )
+        self.mode = sys.intern(mode)
+        self.url = self._URL
+        self._params = {
+            'lat': self.location[0],
+            'lon': self.location[1],
+            'appid': self.api_key,
+            'lang': self.language,
+            'units': self.units,
+            'mode': self.mode
+        }
 
     async def get_weather(self) -> str | CurrentWeatherResponse:
         """
@@ -188,19 +293,22 @@ class CurrentWeatherAPI(OpenWeatherMapAPI):
             TooManyRequestsError: If the API rate limit is exceeded.
             OpenWeatherMapException: For internal server errors (500, 502, 503, 504).
         """
-        response = await _make_get_request_async(self.url, json=(self.mode == 'json'))
+        if self.mode == 'json':
+            return CurrentWeatherResponse(await self._get_cached(self.url, self._params, expire=600, tag='weather'), mode=self.mode)
+        response = await self._get(self.url, self._params, json=False)
         if self.mode != 'html':
             return CurrentWeatherResponse(response, mode=self.mode)
         else:
             return response
 
-class FiveDayForecast(OpenWeatherMapAPI):
+class FiveDayForecast(AsyncOpenWeatherMapAPI):
     """
     Asynchronous class for handling OpenWeatherMap 5-Day Forecast API requests.
     This class is designed to be used with the 5-Day Forecast API endpoint.
     """
+    _URL: ClassVar[str] = "https://api.openweathermap.org/data/2.5/forecast"
 
-    def __init__(self, api_key: str, location: str | tuple, count: int = -1, language: str = 'en', units: Literal['standard', 'metric', 'imperial'] = 'standard', mode:Literal['json', 'xml']='json') -> None:
+    def __init__(self, api_key: str, location: str | tuple, count: int = -1, language: str = 'en', units: Literal['standard', 'metric', 'imperial'] = 'standard', mode:Literal['json', 'xml']='json', rate_limit: tuple[int, float] | None = None, timeout: tuple[float, float] = (3.05, 10.0), cache: bool = False, session: aiohttp.ClientSession | None = None) -> None:
         """
         Initializes the FiveDayForecast API wrapper.
 
@@ -211,6 +319,10 @@ class FiveDayForecast(OpenWeatherMapAPI):
             language (str, optional): Language for the API response (default is 'en').
             units (Literal['standard', 'metric', 'imperial'], optional): Units for temperature ('standard', 'metric', 'imperial').
             mode (Literal['json', 'xml'], optional): Response format ('json' or 'xml'). Defaults to 'json'.
+            rate_limit (tuple[int, float] | None, optional): Maximum number of requests per period in seconds, e.g. (60, 60.0) for the free plan. Requests over the limit wait until they are allowed. Defaults to None (no limit).
+            timeout (tuple[float, float], optional): Connect and read timeouts for each request in seconds. Defaults to (3.05, 10.0).
+            cache (bool, optional): Cache responses on disk in `~/.cache/openweatherwrap`, each endpoint with its own expiry time. Requires the optional `diskcache` dependency. Defaults to False.
+            session (aiohttp.ClientSession | None, optional): Existing session to send the requests with, e.g. to share one connection pool between several wrappers. It is not closed by `close()`. Defaults to None (the instance creates its own session).
 
         Raises:
             ValueError: If the location is not found when a string is provided.
@@ -218,23 +330,24 @@ class FiveDayForecast(OpenWeatherMapAPI):
             ValueError: If the latitude is not between -90 and 90, and longitude is not between -180 and 180.
             ValueError: If the mode is not 'json' or 'xml'.
         """
-        super().__init__(api_key, location, language, units)
+        super().__init__(api_key, location, language, units, rate_limit=rate_limit, timeout=timeout, cache=cache, session=session)
 
         if mode not in ['json', 'xml']:
             raise ValueError("Mode must be one of 'json' or 'xml'.")
 
-        self.mode = mode
+        self.mode = sys.intern(mode)
         self.count = count
-        self.url = "https://api.openweathermap.org/data/2.5/forecast?lat={lat}&lon={lon}&appid={key}&lang={lang}&units={units}&mode={mode}".format(
-            lat=self.location[0],
-            lon=self.location[1],
-            key=self.api_key,
-            lang=self.language,
-            units=self.units,
-            mode=self.mode
-        )
+        self.url = self._URL
+        self._params = {
+            'lat': self.location[0],
+            'lon': self.location[1],
+            'appid': self.api_key,
+            'lang': self.language,
+            'units': self.units,
+            'mode': self.mode
+        }
         if self.count > 0:
-            self.url += f"&cnt={self.count}"
+            self._params['cnt'] = self.count
 
     async def get_forecast(self) -> FiveDayForecastResponse:
         """
@@ -250,16 +363,21 @@ class FiveDayForecast(OpenWeatherMapAPI):
             TooManyRequestsError: If the API rate limit is exceeded.
             OpenWeatherMapException: For internal server errors (500, 502, 503, 504).
         """
-        response = await _make_get_request_async(self.url, json=(self.mode == 'json'))
+        if self.mode == 'json':
+            return FiveDayForecastResponse(await self._get_cached(self.url, self._params, expire=600, tag='forecast'), mode=self.mode)
+        response = await self._get(self.url, self._params, json=False)
         return FiveDayForecastResponse(response, mode=self.mode)
 
-class AirPollutionAPI(OpenWeatherMapAPI):
+class AirPollutionAPI(AsyncOpenWeatherMapAPI):
     """
     Asynchronous class for handling OpenWeatherMap Air Pollution API requests.
     This class is designed to be used with the Air Pollution API endpoint.
     """
+    _URL: ClassVar[str] = "https://api.openweathermap.org/data/2.5/air_pollution"
+    _URL_FORECAST: ClassVar[str] = _URL + "/forecast"
+    _URL_HISTORY: ClassVar[str] = _URL + "/history"
 
-    def __init__(self, api_key: str, location: str | tuple, language: str = 'en', units: Literal['standard', 'metric', 'imperial'] = 'standard') -> None:
+    def __init__(self, api_key: str, location: str | tuple, language: str = 'en', units: Literal['standard', 'metric', 'imperial'] = 'standard', rate_limit: tuple[int, float] | None = None, timeout: tuple[float, float] = (3.05, 10.0), cache: bool = False, session: aiohttp.ClientSession | None = None) -> None:
         """
         Initializes the AirPollution API wrapper.
 
@@ -268,19 +386,24 @@ class AirPollutionAPI(OpenWeatherMapAPI):
             location (str | tuple): Location as a string (city name) or a tuple (latitude, longitude).
             language (str, optional): Language for the API response (default is 'en').
             units (Literal['standard', 'metric', 'imperial'], optional): Units for temperature ('standard', 'metric', 'imperial').
+            rate_limit (tuple[int, float] | None, optional): Maximum number of requests per period in seconds, e.g. (60, 60.0) for the free plan. Requests over the limit wait until they are allowed. Defaults to None (no limit).
+            timeout (tuple[float, float], optional): Connect and read timeouts for each request in seconds. Defaults to (3.05, 10.0).
+            cache (bool, optional): Cache responses on disk in `~/.cache/openweatherwrap`, each endpoint with its own expiry time. Requires the optional `diskcache` dependency. Defaults to False.
+            session (aiohttp.ClientSession | None, optional): Existing session to send the requests with, e.g. to share one connection pool between several wrappers. It is not closed by `close()`. Defaults to None (the instance creates its own session).
 
         Raises:
             ValueError: If the location is not found when a string is provided.
             ValueError: If the location tuple is not valid (not a tuple of two floats or ints).
             ValueError: If the latitude is not between -90 and 90, and longitude is not between -180 and 180.
         """
-        super().__init__(api_key, location)
+        super().__init__(api_key, location, rate_limit=rate_limit, timeout=timeout, cache=cache, session=session)
 
-        self.url = "https://api.openweathermap.org/data/2.5/air_pollution?lat={lat}&lon={lon}&appid={key}".format(
-            lat=self.location[0],
-            lon=self.location[1],
-            key=self.api_key
-        )
+        self.url = self._URL
+        self._params = {
+            'lat': self.location[0],
+            'lon': self.location[1],
+            'appid': self.api_key
+        }
 
     async def get_air_pollution(self) -> AirPollutionResponse:
         """
@@ -296,7 +419,7 @@ class AirPollutionAPI(OpenWeatherMapAPI):
             TooManyRequestsError: If the API rate limit is exceeded.
             OpenWeatherMapException: For internal server errors (500, 502, 503, 504).
         """
-        response = await _make_get_request_async(self.url)
+        response = await self._get_cached(self.url, self._params, expire=60, tag='air_pollution')
         return AirPollutionResponse(response)
 
     async def get_air_pollution_forecast(self) -> AirPollutionResponse:
@@ -313,8 +436,7 @@ class AirPollutionAPI(OpenWeatherMapAPI):
             TooManyRequestsError: If the API rate limit is exceeded.
             OpenWeatherMapException: For internal server errors (500, 502, 503, 504).
         """
-        url = self.url.replace('air_pollution?', 'air_pollution/forecast?')
-        response = await _make_get_request_async(url)
+        response = await self._get(self._URL_FORECAST, self._params)
         return AirPollutionResponse(response)
 
     async def get_air_pollution_history(self, start: int, end: int) -> AirPollutionResponse:
@@ -335,29 +457,35 @@ class AirPollutionAPI(OpenWeatherMapAPI):
             TooManyRequestsError: If the API rate limit is exceeded.
             OpenWeatherMapException: For internal server errors (500, 502, 503, 504).
         """
-        url = self.url.replace('air_pollution?', 'air_pollution/history?')
-        url += f"&start={start}&end={end}"
-        response = await _make_get_request_async(url)
+        response = await self._get(self._URL_HISTORY, {**self._params, 'start': start, 'end': end})
         return AirPollutionResponse(response)
 
-class GeocodingAPI(OpenWeatherMapAPI):
+class GeocodingAPI(AsyncOpenWeatherMapAPI):
     """
     Asynchronous class for handling OpenWeatherMap Geocoding API requests.
     This class is designed to be used with the Geocoding API endpoint.
     """
+    # Malformed geocoding queries are answered with HTTP 400 instead of 404
+    _ERROR_MAP: ClassVar[dict[int, type[OpenWeatherMapException]]] = {**OpenWeatherMapAPI._ERROR_MAP, 400: NotFoundError}
+    _URL: ClassVar[str] = "https://api.openweathermap.org/geo/1.0/direct"
+    _URL_ZIP: ClassVar[str] = "https://api.openweathermap.org/geo/1.0/zip"
+    _URL_REVERSE: ClassVar[str] = "https://api.openweathermap.org/geo/1.0/reverse"
 
-    def __init__(self, api_key: str) -> None:
+    def __init__(self, api_key: str, rate_limit: tuple[int, float] | None = None, timeout: tuple[float, float] = (3.05, 10.0), cache: bool = False, session: aiohttp.ClientSession | None = None) -> None:
         """
         Initializes the Geocoding API wrapper.
 
         Args:
             api_key (str): Your OpenWeatherMap API key.
+            rate_limit (tuple[int, float] | None, optional): Maximum number of requests per period in seconds, e.g. (60, 60.0) for the free plan. Requests over the limit wait until they are allowed. Defaults to None (no limit).
+            timeout (tuple[float, float], optional): Connect and read timeouts for each request in seconds. Defaults to (3.05, 10.0).
+            cache (bool, optional): Cache responses on disk in `~/.cache/openweatherwrap`, each endpoint with its own expiry time. Requires the optional `diskcache` dependency. Defaults to False.
+            session (aiohttp.ClientSession | None, optional): Existing session to send the requests with, e.g. to share one connection pool between several wrappers. It is not closed by `close()`. Defaults to None (the instance creates its own session).
         """
-        super().__init__(api_key, (0.0, 0.0))
+        super().__init__(api_key, (0.0, 0.0), rate_limit=rate_limit, timeout=timeout, cache=cache, session=session)
 
-        self.url = "https://api.openweathermap.org/geo/1.0/direct?appid={key}&q=".format(
-            key=self.api_key
-        )
+        self.url = self._URL
+        self._params = {'appid': self.api_key}
 
     async def get_by_city(self, city: str, country: str, state_code = None, limit=1) -> GeocodingResponse:
         """
@@ -371,12 +499,31 @@ class GeocodingAPI(OpenWeatherMapAPI):
 
         Returns:
             GeocodingResponse: An instance of GeocodingResponse containing the geocoding data.
+
+        Raises:
+            ValueError: If limit > 5 or limit < 1.
         """
-        url = self.url + f"{city},{state_code},{country}" if state_code else self.url + f"{city},{country}"
-        url += f"&limit={limit}"
-        response = await _make_get_request_async(url)
+        if limit > 5 or limit < 1:
+            raise ValueError("Limit must be between 1 and 5.")
+        query = f"{city},{state_code},{country}" if state_code else f"{city},{country}"
+        response = await self._get_cached(self.url, {**self._params, 'q': query, 'limit': limit}, expire=None, tag='geocoding')
         return GeocodingResponse(response)
 
+    async def get_by_cities(self, queries: list[tuple]) -> list[GeocodingResponse]:
+        """
+        Fetches geocoding data for several cities concurrently.
+
+        All requests share the connections of this instance, so the total time is close to that of the slowest request instead of the sum of all requests.
+        Combine with `rate_limit` to stay within the limits of your subscription.
+
+        Args:
+            queries (list[tuple]): The arguments of `get_by_city` for each city, e.g. `[("London", "GB"), ("Springfield", "US", "IL")]`.
+
+        Returns:
+            list[GeocodingResponse]: The responses, in the same order as the queries.
+        """
+        return list(await asyncio.gather(*(self.get_by_city(*query) for query in queries)))
+
     async def get_by_zip(self, zip_code: str, country: str) -> GeocodingResponse:
         """
         Fetches geocoding data for a zip code and country.
@@ -388,8 +535,7 @@ class GeocodingAPI(OpenWeatherMapAPI):
         Returns:
             GeocodingResponse: An instance of GeocodingResponse containing the geocoding data.
         """
-        url = f"{self.url}{zip_code},{country}"
-        response = await _make_get_request_async(url)
+        response = await self._get_cached(self._URL_ZIP, {**self._params, 'zip': f"{zip_code},{country}"}, expire=None, tag='geocoding')
         return GeocodingResponse(response)
 
     async def get_by_coordinates(self, latitude: float, longitude: float, limit: int = 1) -> GeocodingResponse:
@@ -417,28 +563,60 @@ class GeocodingAPI(OpenWeatherMapAPI):
             raise ValueError("Limit must be between 1 and 5.")
         if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
             raise ValueError("Latitude must be between -90 and 90, and longitude must be between -180 and 180.")
-        url = f"{self.url.replace("&q=", "")}&lat={latitude}&lon={longitude}&limit={limit}"
-        url = url.replace('direct?', 'reverse?')
-        response = await _make_get_request_async(url)
+        # Round to about 11 m, so lookups of nearly the same point share one cache entry
+        response = await self._get_cached(self._URL_REVERSE, {**self._params, 'lat': round(latitude, 4), 'lon': round(longitude, 4), 'limit': limit}, expire=None, tag='geocoding')
         return GeocodingResponse(response)
 
-class WeatherMapsAPI(OpenWeatherMapAPI):
+    async def get_by_coordinates_many(self, coordinates: list[tuple[float, float]], limit: int = 1, concurrency: int = 8) -> list[GeocodingResponse | Exception]:
+        """
+        Fetches the geocoding data for several sets of coordinates concurrently.
+
+        At most `concurrency` requests are in flight at the same time, all sharing the connections of this instance.
+        A failing lookup does not cancel the others: its exception is returned in place of the response, so check the results with `isinstance(result, Exception)`.
+
+        Args:
+            coordinates (list[tuple[float, float]]): The (latitude, longitude) pairs to look up.
+            limit (int, optional): Number of results to return for each pair (default is 1, maximum is 5).
+            concurrency (int, optional): Maximum number of concurrent requests. Defaults to 8.
+
+        Returns:
+            list[GeocodingResponse | Exception]: The responses or raised exceptions, in the same order as the coordinates.
+
+        Raises:
+            ValueError: If concurrency < 1.
+        """
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1.")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def get_one(latitude: float, longitude: float) -> GeocodingResponse:
+            async with semaphore:
+                return await self.get_by_coordinates(latitude, longitude, limit)
+
+        return list(await asyncio.gather(*(get_one(latitude, longitude) for latitude, longitude in coordinates), return_exceptions=True))
+
+class WeatherMapsAPI(AsyncOpenWeatherMapAPI):
     """
     Asynchronous class for handling OpenWeatherMap Weather Map API requests.
     This class is designed to be used with the Weather Map API endpoint.
     """
-    def __init__(self, api_key: str) -> None:
+    _URL: ClassVar[str] = "https://tile.openweathermap.org/map"
+
+    def __init__(self, api_key: str, rate_limit: tuple[int, float] | None = None, timeout: tuple[float, float] = (3.05, 10.0), cache: bool = False, session: aiohttp.ClientSession | None = None) -> None:
         """
         Initializes the Weather Map API wrapper.
 
         Args:
             api_key (str): Your OpenWeatherMap API key.
+            rate_limit (tuple[int, float] | None, optional): Maximum number of requests per period in seconds, e.g. (60, 60.0) for the free plan. Requests over the limit wait until they are allowed. Defaults to None (no limit).
+            timeout (tuple[float, float], optional): Connect and read timeouts for each request in seconds. Defaults to (3.05, 10.0).
+            cache (bool, optional): Cache responses on disk in `~/.cache/openweatherwrap`, each endpoint with its own expiry time. Requires the optional `diskcache` dependency. Defaults to False.
+            session (aiohttp.ClientSession | None, optional): Existing session to send the requests with, e.g. to share one connection pool between several wrappers. It is not closed by `close()`. Defaults to None (the instance creates its own session).
 
         """
-        super().__init__(api_key, (0.0, 0.0))
-        self.url = "https://tile.openweathermap.org/map/LAYER/Z/X/Y.png?appid={key}".format(
-            key=self.api_key,
-        )
+        super().__init__(api_key, (0.0, 0.0), rate_limit=rate_limit, timeout=timeout, cache=cache, session=session)
+        self.url = self._URL
+        self._params = {'appid': self.api_key}
 
     async def get_weathermap(self, layer: Literal["clouds_new", "precipitation_new", "pressure_new", "wind_new", "temp_new", "wind_new"], x: int, y: int, zoom: int) -> bytes:
         """
@@ -484,8 +662,7 @@ class WeatherMapsAPI(OpenWeatherMapAPI):
             raise ValueError("X and Y coordinates must be non-negative integers.")
         if layer not in ["clouds_new", "precipitation_new", "pressure_new", "wind_new", "temp_new", "wind_new"]:
             raise ValueError("Layer must be one of: 'clouds_new', 'precipitation_new', 'pressure_new', 'wind_new', 'temp_new', 'snow_new', 'rain_new'.")
-        url = self.url.replace("LAYER", layer).replace("X", str(x)).replace("Y", str(y)).replace("Z", str(zoom))
-        response = await _make_get_request_async(url, json=False)
+        response = await self._get(f"{self.url}/{layer}/{zoom}/{x}/{y}.png", self._params, json=False)
         return response
 
     async def download_weathermap(self, layer: Literal["clouds_new", "precipitation_new", "pressure_new", "wind_new", "temp_new", "snow_new", "rain_new"], x: int, y: int, zoom: int, filename: str) -> None:
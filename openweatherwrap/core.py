@@ -1,8 +1,25 @@
+from array import array
 from typing import Literal
-import xml.etree.ElementTree as ET
+
+try:
+    from lxml import etree as ET
+except ImportError: # lxml is an optional speedup, fall back to the standard library
+    import xml.etree.ElementTree as ET
+
+def _parse_xml(data: str | bytes):
+    """
+    Parses an XML response into its root element.
+
+    :param data: The XML document as a string or bytes.
+    :return root: The root element of the document.
+    """
+    # lxml refuses strings that contain an encoding declaration, so always parse bytes
+    return ET.fromstring(data.encode() if isinstance(data, str) else data)
 
 class OpenWeatherAlert:
     """A class to represent an alert from the OpenWeather API."""
+    __slots__ = ('sender_name', 'event', 'start', 'end', 'description', 'tags')
+
     def __init__(self, data: dict):
         """
         Initializes the OpenWeatherAlert with the provided data.
@@ -60,6 +77,8 @@ class OpenWeatherAlert:
 
 class OneCallResponse:
     """A class to handle the response from the OpenWeather One Call API."""
+    __slots__ = ('data',)
+
     def __init__(self, data):
         """
         Initializes the OneCallResponse with the provided data.
@@ -444,6 +463,19 @@ class OneCallResponse:
         """
         return [hour.get('weather', [{}])[0].get('icon', None) for hour in self.data.get('hourly', [])]
 
+    def get_hourly_array(self, field: Literal['dt', 'temp', 'feels_like', 'pressure', 'humidity', 'dew_point', 'uvi', 'clouds', 'visibility', 'wind_speed', 'wind_deg', 'wind_gust', 'pop']) -> array:
+        """
+        Returns the values of a numeric field for each hourly forecast entry as a compact array of floats.
+
+        The values are stored in one contiguous buffer of C doubles instead of a list of Python objects, so the array can be wrapped by NumPy without copying, e.g. `numpy.frombuffer(response.get_hourly_array('temp'))`.
+        Missing values are represented as NaN.
+
+        :param field: Name of the numeric hourly field, e.g. 'temp' or 'wind_speed'.
+        :return hourly_array: Array of floats with typecode 'd'.
+        """
+        nan = float('nan')
+        return array('d', [nan if (value := hour.get(field)) is None else value for hour in self.data.get('hourly', [])])
+
     def get_daily_times(self) -> list[int | None]:
         """
         Returns a list of timestamps for each daily forecast entry.
@@ -744,6 +776,8 @@ class OneCallResponse:
 class OneCallAggregationResponse:
     """A class to handle the aggregation response from the OpenWeather One Call API."""
 
+    __slots__ = ('data',)
+
     def __init__(self, data):
         """ Initializes the OneCallAggregationResponse with the provided data.
 
@@ -896,6 +930,8 @@ class OneCallAggregationResponse:
 class OneCallTimestampedResponse:
     """A class to handle the timestamped response from the OpenWeather One Call API."""
 
+    __slots__ = ('data',)
+
     def __init__(self, data):
         """ Initializes the OneCallTimestampedResponse with the provided data.
 
@@ -1090,6 +1126,8 @@ class OneCallTimestampedResponse:
 
 class CurrentWeatherResponse:
     """A class to handle the response from the OpenWeather Current Weather API."""
+    __slots__ = ('data', 'mode', '_root')
+
     def __init__(self, data: dict | str, mode: Literal["json", "xml"]='json'):
         """
         Initializes the CurrentWeatherResponse with the provided data.
@@ -1101,6 +1139,8 @@ class CurrentWeatherResponse:
         """
         self.data = data
         self.mode = mode
+        # Parse XML once instead of on every access
+        self._root = _parse_xml(data) if mode == 'xml' else None
 
     def get_latitude(self) -> float:
         """
@@ -1110,7 +1150,7 @@ class CurrentWeatherResponse:
         :return latitude: Latitude as a float.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             city = root.find('city')
             if city is not None:
                 coord = city.find('coord')
@@ -1128,7 +1168,7 @@ class CurrentWeatherResponse:
         :return longitude: Longitude as a float.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             city = root.find('city')
             if city is not None:
                 coord = city.find('coord')
@@ -1145,7 +1185,7 @@ class CurrentWeatherResponse:
         :return weather_id: Weather condition ID as an integer.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             weather = root.find('weather')
             if weather is not None:
                 return int(weather.get('number', -1))
@@ -1173,7 +1213,7 @@ class CurrentWeatherResponse:
         :return weather_description: Weather description as a string or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             weather = root.find('weather')
             if weather is not None:
                 return weather.get('value', None)
@@ -1188,7 +1228,7 @@ class CurrentWeatherResponse:
         :return weather_icon: Weather icon code as a string or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             weather = root.find('weather')
             if weather is not None:
                 return weather.get('icon', None)
@@ -1217,7 +1257,7 @@ class CurrentWeatherResponse:
         :return temperature: Current temperature as a float or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             temperature = root.find('temperature')
             if temperature is not None:
                 return float(temperature.get('value', 0.0))
@@ -1235,7 +1275,7 @@ class CurrentWeatherResponse:
         :return temperature_unit: Temperature unit as a string or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             temperature = root.find('temperature')
             if temperature is not None:
                 return temperature.get('unit', None)
@@ -1251,7 +1291,7 @@ class CurrentWeatherResponse:
         :return feels_like: Feels-like temperature as a float or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             feels_like = root.find('feels_like')
             if feels_like is not None:
                 return float(feels_like.get('value', 0.0))
@@ -1269,7 +1309,7 @@ class CurrentWeatherResponse:
         :return feels_like_unit: Feels-like temperature unit as a string or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             feels_like = root.find('feels_like')
             if feels_like is not None:
                 return feels_like.get('unit', None)
@@ -1285,7 +1325,7 @@ class CurrentWeatherResponse:
         :return pressure: Atmospheric pressure as an integer or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             pressure = root.find('pressure')
             if pressure is not None:
                 return int(pressure.get('value', 0))
@@ -1303,7 +1343,7 @@ class CurrentWeatherResponse:
         :return pressure_unit: Atmospheric pressure unit as a string or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             pressure = root.find('pressure')
             if pressure is not None:
                 return pressure.get('unit', None)
@@ -1319,7 +1359,7 @@ class CurrentWeatherResponse:
         :return humidity: Humidity as an integer or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             humidity = root.find('humidity')
             if humidity is not None:
                 return int(humidity.get('value', 0))
@@ -1337,7 +1377,7 @@ class CurrentWeatherResponse:
         :return humidity_unit: Humidity unit as a string or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             humidity = root.find('humidity')
             if humidity is not None:
                 return humidity.get('unit', None)
@@ -1353,7 +1393,7 @@ class CurrentWeatherResponse:
         :return min_temperature: Minimum temperature as a float or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             temperature = root.find('temperature')
             if temperature is not None:
                 return float(temperature.get('min', 0.0))
@@ -1369,7 +1409,7 @@ class CurrentWeatherResponse:
         :return max_temperature: Maximum temperature as a float or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             temperature = root.find('temperature')
             if temperature is not None:
                 return float(temperature.get('max', 0.0))
@@ -1415,7 +1455,7 @@ class CurrentWeatherResponse:
         :return visibility: Visibility as an integer or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             visibility = root.find('visibility')
             if visibility is not None:
                 return int(visibility.get('value', 0))
@@ -1431,7 +1471,7 @@ class CurrentWeatherResponse:
         :return wind_speed: Wind speed as a float or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             wind = root.find('wind')
             if wind is not None:
                 speed = wind.find('speed')
@@ -1451,7 +1491,7 @@ class CurrentWeatherResponse:
         :return wind_speed_unit: Wind speed unit as a string or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             wind = root.find('wind')
             if wind is not None:
                 speed = wind.find('speed')
@@ -1471,7 +1511,7 @@ class CurrentWeatherResponse:
         :return wind_speed_name: Wind speed name as a string or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             wind = root.find('wind')
             if wind is not None:
                 speed = wind.find('speed')
@@ -1489,7 +1529,7 @@ class CurrentWeatherResponse:
         :return wind_deg: Wind direction as an integer or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             wind = root.find('wind')
             if wind is not None:
                 direction = wind.find('direction')
@@ -1509,7 +1549,7 @@ class CurrentWeatherResponse:
         :return wind_direction: Wind direction as a string or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             wind = root.find('wind')
             if wind is not None:
                 direction = wind.find('direction')
@@ -1529,7 +1569,7 @@ class CurrentWeatherResponse:
         :return wind_direction_full: Full wind direction as a string or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             wind = root.find('wind')
             if wind is not None:
                 direction = wind.find('direction')
@@ -1561,7 +1601,7 @@ class CurrentWeatherResponse:
         :return clouds: Cloudiness as an integer or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             clouds = root.find('clouds')
             if clouds is not None:
                 return int(clouds.get('value', 0))
@@ -1579,7 +1619,7 @@ class CurrentWeatherResponse:
         :return clouds_name: Cloudiness name as a string or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             clouds = root.find('clouds')
             if clouds is not None:
                 return clouds.get('name', None)
@@ -1595,7 +1635,7 @@ class CurrentWeatherResponse:
         :return rain: Rain volume as a float or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             precipitation = root.find('precipitation')
             if precipitation is not None:
                 mode = precipitation.get('mode', 'no')
@@ -1615,7 +1655,7 @@ class CurrentWeatherResponse:
         :return snow: Snow volume as a float or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             precipitation = root.find('precipitation')
             if precipitation is not None:
                 mode = precipitation.get('mode', 'no')
@@ -1693,7 +1733,7 @@ class CurrentWeatherResponse:
         :return country: Country code as a string or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             city = root.find('city')
             if city is not None:
                 return city.get('country', None)
@@ -1710,7 +1750,7 @@ class CurrentWeatherResponse:
         :return sunrise: Sunrise time as an integer (Unix timestamp) or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             city = root.find('city')
             if city is not None:
                 sun = city.find('sun')
@@ -1730,7 +1770,7 @@ class CurrentWeatherResponse:
         :return sunset: Sunset time as an integer (Unix timestamp) or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             city = root.find('city')
             if city is not None:
                 sun = city.find('sun')
@@ -1748,7 +1788,7 @@ class CurrentWeatherResponse:
         :return timezone: Timezone offset as an integer (seconds) or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             city = root.find('city')
             if city is not None:
                 return int(city.get('timezone', 0))
@@ -1764,7 +1804,7 @@ class CurrentWeatherResponse:
         :return city_id: City ID as an integer or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             city = root.find('city')
             if city is not None:
                 return int(city.get('id', 0))
@@ -1780,7 +1820,7 @@ class CurrentWeatherResponse:
         :return city_name: City name as a string or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             city = root.find('city')
             if city is not None:
                 return city.get('name', None)
@@ -1798,7 +1838,7 @@ class CurrentWeatherResponse:
         :return last_update: Last update time as an integer (Unix timestamp) or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             lastupdate = root.find('lastupdate')
             if lastupdate is not None:
                 return lastupdate.get('value', None)
@@ -1808,6 +1848,8 @@ class CurrentWeatherResponse:
 
 class FiveDayForecastResponse:
     """A class to handle the response from the OpenWeather 5-Day Forecast API."""
+    __slots__ = ('data', 'mode', '_root')
+
     def __init__(self, data: dict | str, mode: Literal["json", "xml"]='json'):
         """
         Initializes the FiveDayForecastResponse with the provided data.
@@ -1819,6 +1861,8 @@ class FiveDayForecastResponse:
         """
         self.data = data
         self.mode = mode
+        # Parse XML once instead of on every access
+        self._root = _parse_xml(data) if mode == 'xml' else None
 
     def get_message(self) -> int:
         """
@@ -1873,7 +1917,7 @@ class FiveDayForecastResponse:
         :return temperature: List of temperatures (floats).
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             temperatures = []
             forecast = root.find('forecast')
             for entry in forecast.findall('time'):
@@ -1896,7 +1940,7 @@ class FiveDayForecastResponse:
         :return temperature_unit: Temperature unit as a string.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             units = []
             forecast = root.find('forecast')
             for entry in forecast.findall('time'):
@@ -1917,7 +1961,7 @@ class FiveDayForecastResponse:
         :return feels_like: List of feels-like temperatures (floats).
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             feels_like_temps = []
             forecast = root.find('forecast')
             if forecast is not None:
@@ -1943,7 +1987,7 @@ class FiveDayForecastResponse:
         :return feels_like_unit: Feels-like temperature unit as a string.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             units = []
             forecast = root.find('forecast')
             if forecast is not None:
@@ -1967,7 +2011,7 @@ class FiveDayForecastResponse:
         :return min_temperature: List of minimum temperatures (floats).
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             min_temps = []
             forecast = root.find('forecast')
             for entry in forecast.findall('time'):
@@ -1988,7 +2032,7 @@ class FiveDayForecastResponse:
         :return max_temperature: List of maximum temperatures (floats).
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             max_temps = []
             forecast = root.find('forecast')
             for entry in forecast.findall('time'):
@@ -2009,7 +2053,7 @@ class FiveDayForecastResponse:
         :return pressure: List of atmospheric pressures (integers).
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             pressures = []
             forecast = root.find('forecast')
             for entry in forecast.findall('time'):
@@ -2032,7 +2076,7 @@ class FiveDayForecastResponse:
         :return pressure_unit: Atmospheric pressure unit as a string.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             units = []
             forecast = root.find('forecast')
             for entry in forecast.findall('time'):
@@ -2081,7 +2125,7 @@ class FiveDayForecastResponse:
         :return humidity: List of humidity values (integers).
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             humidities = []
             forecast = root.find('forecast')
             if forecast is not None:
@@ -2107,7 +2151,7 @@ class FiveDayForecastResponse:
         :return humidity_unit: Humidity unit as a string.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             units = []
             forecast = root.find('forecast')
             if forecast is not None:
@@ -2131,7 +2175,7 @@ class FiveDayForecastResponse:
         :return weather_id: List of weather condition IDs (integers).
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             weather_ids = []
             forecast = root.find('forecast')
             for entry in forecast.findall('time'):
@@ -2166,7 +2210,7 @@ class FiveDayForecastResponse:
         :return weather_description: List of weather condition descriptions (strings).
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             weather_mains = []
             forecast = root.find('forecast')
             for entry in forecast.findall('time'):
@@ -2187,7 +2231,7 @@ class FiveDayForecastResponse:
         :return weather_icon: List of weather condition icons (strings).
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             weather_icons = []
             forecast = root.find('forecast')
             for entry in forecast.findall('time'):
@@ -2208,7 +2252,7 @@ class FiveDayForecastResponse:
         :return clouds: List of cloudiness values (integers).
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             clouds_list = []
             forecast = root.find('forecast')
             if forecast is not None:
@@ -2234,7 +2278,7 @@ class FiveDayForecastResponse:
         :return clouds_name: List of cloudiness names (strings).
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             clouds_list = []
             forecast = root.find('forecast')
             if forecast is not None:
@@ -2260,7 +2304,7 @@ class FiveDayForecastResponse:
         :return clouds_unit: Cloudiness unit as a string or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             units = []
             forecast = root.find('forecast')
             if forecast is not None:
@@ -2284,7 +2328,7 @@ class FiveDayForecastResponse:
         :return wind_speed: List of wind speeds (floats).
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             wind_speeds = []
             forecast = root.find('forecast')
             for entry in forecast.findall('time'):
@@ -2307,7 +2351,7 @@ class FiveDayForecastResponse:
         :return wind_speed_unit: Wind speed unit as a string or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             units = []
             forecast = root.find('forecast')
             for entry in forecast.findall('time'):
@@ -2330,7 +2374,7 @@ class FiveDayForecastResponse:
         :return wind_speed_name: List of wind speed names (strings).
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             wind_speed_names = []
             forecast = root.find('forecast')
             for entry in forecast.findall('time'):
@@ -2351,7 +2395,7 @@ class FiveDayForecastResponse:
         :return wind_deg: List of wind degrees (floats).
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             wind_degrees = []
             forecast = root.find('forecast')
             for entry in forecast.findall('time'):
@@ -2374,7 +2418,7 @@ class FiveDayForecastResponse:
         :return wind_direction: List of wind directions (strings).
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             wind_directions = []
             forecast = root.find('forecast')
             for entry in forecast.findall('time'):
@@ -2397,7 +2441,7 @@ class FiveDayForecastResponse:
         :return wind_direction_full: List of full wind directions (strings).
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             wind_direction_fulls = []
             forecast = root.find('forecast')
             for entry in forecast.findall('time'):
@@ -2418,7 +2462,7 @@ class FiveDayForecastResponse:
         :return wind_gust: List of wind gusts (floats).
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             wind_gusts = []
             forecast = root.find('forecast')
             for entry in forecast.findall('time'):
@@ -2441,7 +2485,7 @@ class FiveDayForecastResponse:
         :return wind_gust_unit: Wind gust unit as a string or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             units = []
             forecast = root.find('forecast')
             for entry in forecast.findall('time'):
@@ -2462,7 +2506,7 @@ class FiveDayForecastResponse:
         :return visibility: List of visibility values (integers).
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             visibilities = []
             forecast = root.find('forecast')
             for entry in forecast.findall('time'):
@@ -2483,7 +2527,7 @@ class FiveDayForecastResponse:
         :return pop: List of POP values (floats).
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             pops = []
             forecast = root.find('forecast')
             if forecast is not None:
@@ -2507,7 +2551,7 @@ class FiveDayForecastResponse:
         :return rain: List of rain volumes (floats).
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             rains = []
             forecast = root.find('forecast')
             for entry in forecast.findall('time'):
@@ -2531,7 +2575,7 @@ class FiveDayForecastResponse:
         :return snow: List of snow volumes (floats).
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             snows = []
             forecast = root.find('forecast')
             for entry in forecast.findall('time'):
@@ -2583,7 +2627,7 @@ class FiveDayForecastResponse:
         :return city_name: City name as a string or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             location = root.find('location')
             if location is not None:
                 name = location.find('name')
@@ -2600,7 +2644,7 @@ class FiveDayForecastResponse:
         :return latitude: Latitude as a float or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             location = root.find('location')
             if location is not None:
                 location2 = location.find('location')
@@ -2618,7 +2662,7 @@ class FiveDayForecastResponse:
         :return longitude: Longitude as a float or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             location = root.find('location')
             if location is not None:
                 location2 = location.find('location')
@@ -2636,7 +2680,7 @@ class FiveDayForecastResponse:
         :return country: Country code as a string or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             location = root.find('location')
             if location is not None:
                 country = location.find('country')
@@ -2668,7 +2712,7 @@ class FiveDayForecastResponse:
         :return timezone: Timezone offset as an integer.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             location = root.find('location')
             if location is not None:
                 return int(location.find('timezone').text)
@@ -2686,7 +2730,7 @@ class FiveDayForecastResponse:
         .. _ISO 8601: https://en.wikipedia.org/wiki/ISO_8601
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             sun = root.find('sun')
             if sun is not None:
                 return sun.get('rise', "1970-01-01T00:00:00Z")
@@ -2704,7 +2748,7 @@ class FiveDayForecastResponse:
         .. _ISO 8601: https://en.wikipedia.org/wiki/ISO_8601
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             sun = root.find('sun')
             if sun is not None:
                 return sun.get('set', "1970-01-01T00:00:00Z")
@@ -2722,7 +2766,7 @@ class FiveDayForecastResponse:
         :return altitude: Altitude as a float or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             location = root.find('location')
             if location is not None:
                 location2 = location.find('location')
@@ -2742,7 +2786,7 @@ class FiveDayForecastResponse:
         :return geobase: Geobase as a string or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             location = root.find('location')
             if location is not None:
                 location2 = location.find('location')
@@ -2762,7 +2806,7 @@ class FiveDayForecastResponse:
         :return geobase_id: Geobase ID as an integer or None.
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             location = root.find('location')
             if location is not None:
                 location2 = location.find('location')
@@ -2782,7 +2826,7 @@ class FiveDayForecastResponse:
         :return last_update: Last update time as an integer (Unix timestamp).
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             meta = root.find('meta')
             if meta is not None:
                 return meta.find('lastupdate').text
@@ -2800,7 +2844,7 @@ class FiveDayForecastResponse:
         :return calc_time: Calculation time as an integer (Unix timestamp).
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             meta = root.find('meta')
             if meta is not None:
                 calctime = meta.find('calctime')
@@ -2820,7 +2864,7 @@ class FiveDayForecastResponse:
         :return next_update: Next update time as an integer (Unix timestamp).
         """
         if self.mode == 'xml':
-            root = ET.fromstring(self.data)
+            root = self._root
             meta = root.find('meta')
             if meta is not None:
                 return meta.find('nextupdate').text
@@ -2834,6 +2878,8 @@ class AirPollutionResponse:
     It provides methods to extract various air quality parameters from the response data.
     """
 
+    __slots__ = ('data',)
+
     def __init__(self, data: dict):
         """
         Initializes the AirPollutionResponse with the provided data and mode.
@@ -2948,6 +2994,8 @@ class GeocodingResponse:
     It provides methods to extract various geocoding parameters from the response data.
     """
 
+    __slots__ = ('data',)
+
     def __init__(self, data: dict | list[dict]) -> None:
         """
         Initializes the GeocodingResponse with the provided data.